@@ -1,4 +1,16 @@
 #!/usr/bin/env bash
 # hawk-hook: events=post_tool_use
 # hawk-hook: description=OWL AFK post-tool-use handler
+# Fast path: answer without starting Python when owl is not enabled
+# (same rules as owl.fast_path.check_fast_path)
+mode_file="${OWL_DIR:-$HOME/.config/owl}/mode"
+if [[ ! -e "$mode_file" ]]; then
+    echo '{"decision": "approve"}'
+    exit 0
+fi
+read -r mode < "$mode_file"
+if [[ "$mode" == "off" ]]; then
+    echo '{}'
+    exit 0
+fi
 exec owl hook PostToolUse
@@ -1,11 +1,10 @@
 """owl - Remote approval system for Claude Code."""
 
-from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
-__version__ = version("owl-afk")
-
-from owl.core.manager import ApprovalManager
-from owl.notifiers import ConsoleNotifier, Notifier, TelegramNotifier
+if TYPE_CHECKING:
+    from owl.core.manager import ApprovalManager
+    from owl.notifiers import ConsoleNotifier, Notifier, TelegramNotifier
 
 __all__ = [
     "ApprovalManager",
@@ -13,3 +12,25 @@ __all__ = [
     "ConsoleNotifier",
     "TelegramNotifier",
 ]
+
+# Exports are imported on first access (PEP 562), so hooks that only need
+# a light submodule don't pay for aiosqlite/httpx at startup
+_LAZY_EXPORTS = {
+    "ApprovalManager": "owl.core.manager",
+    "Notifier": "owl.notifiers",
+    "ConsoleNotifier": "owl.notifiers",
+    "TelegramNotifier": "owl.notifiers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # importlib.metadata (and the email package under it) is slow to load
+        from importlib.metadata import version
+
+        return version("owl-afk")
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
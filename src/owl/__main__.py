@@ -1,6 +1,24 @@
-"""Allow running as python -m owl."""
+"""Allow running as python -m owl; also the owl/afk console script entry."""
+
+import sys
+
+
+def cli_main() -> None:
+    """Entry point for pyproject.toml scripts.
+
+    `owl hook <HookType>` runs on every Claude Code tool call, so it goes
+    straight to the hook dispatcher without importing Typer and the CLI.
+    """
+    if len(sys.argv) >= 3 and sys.argv[1] == "hook":
+        from owl.hooks.handler import main
+
+        main()
+        return
+
+    from owl.cli import cli_main as typer_main
+
+    typer_main()
 
-from owl.cli import main
 
 if __name__ == "__main__":
-    main()
+    cli_main()
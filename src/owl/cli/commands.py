@@ -279,25 +279,26 @@ def cmd_reset(args):
 def cmd_hook(args):
     """Internal hook handler."""
     from owl.fast_path import FastPathResult, check_fast_path
+    from owl.hooks.response import write_response
     from owl.utils.debug import log_error
 
     owl_dir = get_owl_dir()
 
     result = check_fast_path()
     if result == FastPathResult.APPROVE:
-        print(json.dumps({"decision": "approve"}))
+        write_response({"decision": "approve"})
         return
     elif result == FastPathResult.DENY:
-        print(json.dumps({"decision": "deny"}))
+        write_response({"decision": "deny"})
         return
     elif result == FastPathResult.FALLBACK:
-        print(json.dumps({}))
+        write_response({})
         return
 
     try:
         hook_input = json.load(sys.stdin)
     except json.JSONDecodeError:
-        print(json.dumps({"error": "Invalid JSON input"}))
+        write_response({"error": "Invalid JSON input"})
         sys.exit(1)
 
     try:
@@ -305,7 +306,7 @@ def cmd_hook(args):
         from owl.hooks.handler import handle_hook
 
         response = asyncio.run(handle_hook(args.hook_type, hook_input, owl_dir))
-        print(json.dumps(response))
+        write_response(response)
     except Exception as e:
         # Log the full error with traceback (always, even if debug is off)
         log_error(
@@ -315,7 +316,7 @@ def cmd_hook(args):
         )
         # Return empty dict to gracefully fall back to CLI approval
         # This prevents silent failures - user will see CLI prompt AND error in logs
-        print(json.dumps({}))
+        write_response({})
 
 
 def cmd_debug_on(args):
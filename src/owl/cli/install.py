@@ -44,6 +44,21 @@ HOOK_CONFIG = {
 }
 HOOK_EVENTS = list(HOOK_CONFIG.keys())
 
+# Shell version of owl.fast_path.check_fast_path for wrapper scripts, so
+# hooks answer without starting Python when owl is not enabled
+SHELL_FAST_PATH = """\
+mode_file="${OWL_DIR:-$HOME/.config/owl}/mode"
+if [[ ! -e "$mode_file" ]]; then
+    echo '{"decision": "approve"}'
+    exit 0
+fi
+read -r mode < "$mode_file"
+if [[ "$mode" == "off" ]]; then
+    echo '{}'
+    exit 0
+fi
+"""
+
 
 def get_claude_settings_path() -> Path:
     """Get path to Claude settings.json."""
@@ -359,7 +374,7 @@ def do_hawk_hooks_install(force: bool = False):
         wrapper_content = f"""#!/usr/bin/env bash
 # Description: {description}
 # Deps: owl
-{timeout_line}exec owl hook {hook_type}
+{timeout_line}{SHELL_FAST_PATH}exec owl hook {hook_type}
 """
         wrapper_path.write_text(wrapper_content)
         wrapper_path.chmod(0o755)
@@ -8,12 +8,31 @@ This package provides:
 - Command parsing utilities
 """
 
-from owl.core.manager import ApprovalManager
-from owl.core.rules import RulesEngine
-from owl.core.storage import Storage
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from owl.core.manager import ApprovalManager
+    from owl.core.rules import RulesEngine
+    from owl.core.storage import Storage
 
 __all__ = [
     "ApprovalManager",
     "RulesEngine",
     "Storage",
 ]
+
+# Imported on first access (PEP 562): importing any owl.core submodule
+# runs this file, and the manager pulls in the poller and httpx
+_LAZY_EXPORTS = {
+    "ApprovalManager": "owl.core.manager",
+    "RulesEngine": "owl.core.rules",
+    "Storage": "owl.core.storage",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,10 @@
 """Approval and denial handlers."""
 
-from owl.core.handlers.base import CallbackContext, check_request_pending
+from owl.core.handlers.base import (
+    CallbackContext,
+    answer_request_expired,
+    check_request_pending,
+)
 from owl.core.handlers.registry import HandlerRegistry
 from owl.core.handlers.utils import format_resolved_message
 from owl.utils.debug import debug_callback
@@ -22,9 +26,7 @@ class ApproveHandler:
             request = await ctx.storage.get_request(ctx.target_id)
             if not request:
                 debug_callback("Request not found", request_id=ctx.target_id)
-                await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-                if ctx.message_id:
-                    await ctx.notifier.edit_message(ctx.message_id, "Request expired")
+                await answer_request_expired(ctx, "Request expired")
                 return
 
             # Skip if already resolved (handles duplicate callbacks from multiple pollers)
@@ -101,9 +103,7 @@ class DenyHandler:
             request = await ctx.storage.get_request(ctx.target_id)
             if not request:
                 debug_callback("Request not found", request_id=ctx.target_id)
-                await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-                if ctx.message_id:
-                    await ctx.notifier.edit_message(ctx.message_id, "Request expired")
+                await answer_request_expired(ctx, "Request expired")
                 return
 
             # Skip if already resolved (handles duplicate callbacks from multiple pollers)
@@ -1,5 +1,6 @@
 """Base classes for callback handlers."""
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, Protocol
 
@@ -86,6 +87,27 @@ async def check_request_pending(
     return True
 
 
+async def answer_request_expired(
+    ctx: "CallbackContext", expired_text: str = "✗ Request expired"
+) -> None:
+    """Answer a callback whose request no longer exists and mark its message.
+
+    The callback answer and the message edit are independent Bot API calls,
+    so they're sent together rather than one round trip after the other.
+
+    Args:
+        ctx: Callback context
+        expired_text: Text that replaces the message
+    """
+    if ctx.message_id:
+        await asyncio.gather(
+            ctx.notifier.answer_callback(ctx.callback_id, "Request not found"),
+            ctx.notifier.edit_message(ctx.message_id, expired_text),
+        )
+    else:
+        await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
+
+
 class CallbackHandler(Protocol):
     """Protocol for callback handlers.
 
@@ -5,7 +5,7 @@ import json
 from typing import TYPE_CHECKING, Any, Optional
 
 from owl.core.command_parser import CommandParser
-from owl.core.handlers.base import CallbackContext
+from owl.core.handlers.base import CallbackContext, answer_request_expired
 from owl.utils.debug import debug_callback, debug_chain
 from owl.utils.formatting import (
     escape_html,
@@ -163,9 +163,7 @@ class ChainApproveHandler:
             request = await ctx.storage.get_request(request_id)
             if not request:
                 debug_chain("Request not found", request_id=request_id)
-                await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-                if ctx.message_id:
-                    await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+                await answer_request_expired(ctx)
                 return
 
             # Skip if already resolved - clean up stale keyboard
@@ -307,9 +305,7 @@ class ChainDenyHandler:
 
         request = await ctx.storage.get_request(request_id)
         if not request:
-            await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-            if ctx.message_id:
-                await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+            await answer_request_expired(ctx)
             return
 
         # Resolve as denied
@@ -372,9 +368,7 @@ class ChainDenyMsgHandler:
         request = await ctx.storage.get_request(request_id)
         if not request:
             debug_callback("Request not found", request_id=request_id)
-            await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-            if ctx.message_id:
-                await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+            await answer_request_expired(ctx)
             return
 
         # Store chain context for when feedback arrives
@@ -407,9 +401,7 @@ class ChainApproveAllHandler:
         try:
             request = await ctx.storage.get_request(request_id)
             if not request:
-                await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-                if ctx.message_id:
-                    await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+                await answer_request_expired(ctx)
                 return
 
             # Skip if already resolved - clean up stale keyboard
@@ -496,9 +488,7 @@ class ChainApproveEntireHandler:
         try:
             request = await ctx.storage.get_request(request_id)
             if not request:
-                await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-                if ctx.message_id:
-                    await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+                await answer_request_expired(ctx)
                 return
 
             # Skip if already resolved - clean up stale keyboard
@@ -615,9 +605,7 @@ class ChainCancelRuleHandler:
 
         request = await ctx.storage.get_request(request_id)
         if not request:
-            await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-            if ctx.message_id:
-                await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+            await answer_request_expired(ctx)
             return
 
         # Note: callback already answered by poller
@@ -668,9 +656,7 @@ class ChainRuleHandler:
 
         request = await ctx.storage.get_request(request_id)
         if not request:
-            await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-            if ctx.message_id:
-                await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+            await answer_request_expired(ctx)
             return
 
         # Get chain state
@@ -743,9 +729,7 @@ class ChainRulePatternHandler:
         try:
             request = await ctx.storage.get_request(request_id)
             if not request:
-                await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-                if ctx.message_id:
-                    await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+                await answer_request_expired(ctx)
                 return
 
             # Get chain state
@@ -1,6 +1,6 @@
 """Feedback/message handlers for deny with message."""
 
-from owl.core.handlers.base import CallbackContext
+from owl.core.handlers.base import CallbackContext, answer_request_expired
 from owl.core.handlers.registry import HandlerRegistry
 from owl.utils.debug import debug_callback
 
@@ -16,9 +16,7 @@ class DenyWithMessageHandler:
 
         request = await ctx.storage.get_request(request_id)
         if not request:
-            await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-            if ctx.message_id:
-                await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+            await answer_request_expired(ctx)
             return
 
         # Send feedback prompt
@@ -1,6 +1,6 @@
 """Rule management handlers."""
 
-from owl.core.handlers.base import CallbackContext
+from owl.core.handlers.base import CallbackContext, answer_request_expired
 from owl.core.handlers.registry import HandlerRegistry
 from owl.utils.debug import debug_callback
 from owl.utils.formatting import format_project_id, format_tool_summary
@@ -18,9 +18,7 @@ class AddRuleMenuHandler:
 
         request = await ctx.storage.get_request(request_id)
         if not request:
-            await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-            if ctx.message_id:
-                await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+            await answer_request_expired(ctx)
             return
 
         # Get session for project_path
@@ -79,9 +77,7 @@ class AddRulePatternHandler:
         try:
             request = await ctx.storage.get_request(request_id)
             if not request:
-                await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-                if ctx.message_id:
-                    await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+                await answer_request_expired(ctx)
                 return
 
             # Get session for project_path
@@ -206,9 +202,7 @@ class CancelRuleHandler:
 
         request = await ctx.storage.get_request(request_id)
         if not request:
-            await ctx.notifier.answer_callback(ctx.callback_id, "Request not found")
-            if ctx.message_id:
-                await ctx.notifier.edit_message(ctx.message_id, "✗ Request expired")
+            await answer_request_expired(ctx)
             return
 
         await ctx.notifier.answer_callback(ctx.callback_id, "Cancelled")
@@ -1,18 +1,25 @@
 """Telegram poller with file-based locking."""
 
 import asyncio
+import contextlib
 import fcntl
 import json
 import os
 import sys
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from owl.core.handlers import HandlerDispatcher
 from owl.core.storage import Storage
 from owl.notifiers.telegram import TelegramNotifier
-from owl.utils.debug import debug_callback
+from owl.utils.constants import (
+    MAX_CONCURRENT_EDITS,
+    WAIT_INTERVAL_MAX,
+    WAIT_INTERVAL_MIN,
+    WAIT_LONG_POLL,
+)
+from owl.utils.debug import append_log, debug_callback, debug_enabled
 from owl.utils.formatting import format_project_id
 
 
@@ -24,6 +31,78 @@ def _safe_int(value: str, default: int = 0) -> int:
         return default
 
 
+async def sleep_remainder(started: float, interval: float) -> None:
+    """Sleep for whatever is left of interval since started.
+
+    getUpdates long-polls, so a cycle that already waited on the network
+    goes straight into the next poll; cycles that return early (errors,
+    first fetch with timeout=0) are still paced to one per interval.
+    """
+    remaining = interval - (time.monotonic() - started)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+
+async def wait_until_resolved(
+    poller: "Poller",
+    fetch_entry: Callable[[], Awaitable[Optional[dict[str, Any]]]],
+    timeout: float,
+) -> Optional[dict[str, Any]]:
+    """Wait until a pending Stop/SubagentStop entry is no longer pending.
+
+    While no other process holds the poll lock, Telegram updates are
+    long-polled in a background task under that lock, which wakes the wait
+    as soon as it handles one. Replies handled by another process (the
+    polling leader, the CLI) only show up in the database, so the entry is
+    also re-read on a backoff from WAIT_INTERVAL_MIN to WAIT_INTERVAL_MAX.
+
+    Returns the resolved entry, or None if timeout passed first.
+    """
+    woken = asyncio.Event()
+
+    async def poll_updates() -> None:
+        # Only one getUpdates may be open per bot, so leave polling to the
+        # leader while it holds the lock and retry the lock now and then
+        while not await poller.lock.acquire(timeout=0):
+            await asyncio.sleep(WAIT_INTERVAL_MAX)
+        try:
+            while True:
+                cycle_start = time.monotonic()
+                try:
+                    if await poller.process_updates_once(timeout=WAIT_LONG_POLL):
+                        woken.set()
+                except Exception:
+                    pass
+                # Polls cut short by errors are paced to one per second
+                await sleep_remainder(cycle_start, 1.0)
+        finally:
+            await poller.lock.release()
+
+    poll_task = asyncio.create_task(poll_updates())
+    deadline = time.monotonic() + timeout
+    interval = WAIT_INTERVAL_MIN
+    try:
+        while True:
+            # Clear before reading so a wake during the read isn't lost
+            woken.clear()
+            entry = await fetch_entry()
+            if entry and entry["status"] != "pending":
+                return entry
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(woken.wait(), min(interval, remaining))
+                interval = WAIT_INTERVAL_MIN
+            except asyncio.TimeoutError:
+                interval = min(interval * 1.5, WAIT_INTERVAL_MAX)
+    finally:
+        poll_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await poll_task
+
+
 class PollLock:
     """File-based lock for single poller."""
 
@@ -113,8 +192,9 @@ class Poller:
         """Log debug message to file and stderr."""
         import time as time_module
 
-        with open(self._debug_log, "a") as f:
-            f.write(f"{time_module.strftime('%H:%M:%S')} [poller] {msg}\n")
+        append_log(
+            self._debug_log, f"{time_module.strftime('%H:%M:%S')} [poller] {msg}"
+        )
         try:
             print(f"[owl] {msg}", file=sys.stderr, flush=True)
         except BrokenPipeError:
@@ -186,6 +266,7 @@ class Poller:
 
             while True:
                 # Poll Telegram for updates
+                cycle_start = time.monotonic()
                 await self.process_updates_once()
 
                 # Check if our own request is resolved
@@ -216,7 +297,7 @@ class Poller:
                             debug_callback("Leader: grace period expired, stopping")
                             break
 
-                await asyncio.sleep(poll_interval)
+                await sleep_remainder(cycle_start, poll_interval)
 
             return True
         finally:
@@ -230,9 +311,12 @@ class Poller:
             return update["callback_query"].get("message", {}).get("date", 0)
         return 0
 
-    async def process_updates_once(self) -> int:
+    async def process_updates_once(self, timeout: int = 1) -> int:
         """Process one batch of updates.
 
+        Args:
+            timeout: getUpdates long-poll timeout in seconds
+
         Returns number of updates processed.
         """
         try:
@@ -287,7 +371,7 @@ class Poller:
             else:
                 updates = await self.notifier.get_updates(
                     offset=self._offset,
-                    timeout=1,
+                    timeout=timeout,
                 )
 
             processed = 0
@@ -305,10 +389,11 @@ class Poller:
 
             return processed
         except Exception as e:
-            import traceback
-
             debug_callback("Error in process_updates_once", error=str(e)[:200])
-            debug_callback("Traceback", tb=traceback.format_exc()[:500])
+            if debug_enabled():
+                import traceback
+
+                debug_callback("Traceback", tb=traceback.format_exc()[:500])
             return 0
 
     async def _handle_message(self, message: dict[str, Any]) -> None:
@@ -463,7 +548,7 @@ class Poller:
         if session:
             short_id = session.session_id[:8]
             project = (
-                session.project_path.split("/")[-1]
+                session.project_path.rsplit("/", 1)[-1]
                 if session.project_path
                 else "unknown"
             )
@@ -498,7 +583,9 @@ class Poller:
             buttons = []
             for s in sessions[-6:]:  # Last 6 sessions (Telegram limit)
                 short_id = s.session_id[:8]
-                project = s.project_path.split("/")[-1] if s.project_path else "unknown"
+                project = (
+                    s.project_path.rsplit("/", 1)[-1] if s.project_path else "unknown"
+                )
                 buttons.append(
                     [
                         {
@@ -549,7 +636,9 @@ class Poller:
 
         short_id = session.session_id[:8]
         project = (
-            session.project_path.split("/")[-1] if session.project_path else "unknown"
+            session.project_path.rsplit("/", 1)[-1]
+            if session.project_path
+            else "unknown"
         )
         await self.notifier.send_message(
             f"✓ Message queued for <code>{short_id}</code> ({project})"
@@ -576,7 +665,9 @@ class Poller:
         session = matching[0]
         short_id = session.session_id[:8]
         project = (
-            session.project_path.split("/")[-1] if session.project_path else "unknown"
+            session.project_path.rsplit("/", 1)[-1]
+            if session.project_path
+            else "unknown"
         )
         self._log_debug(f"Selected session: {session.session_id[:16]} ({project})")
 
@@ -679,20 +770,35 @@ class Poller:
 
             # Resolve all pending requests with "fallback" status
             # This tells the hook to return empty response, triggering CLI prompt
-            for request in pending:
-                await self.storage.resolve_request(
-                    request_id=request.id,
-                    status="fallback",
-                    resolved_by="afk_off",
-                )
-                # Update the Telegram message if exists
-                if request.telegram_msg_id:
+            async with self.storage.batch():
+                for request in pending:
+                    await self.storage.resolve_request(
+                        request_id=request.id,
+                        status="fallback",
+                        resolved_by="afk_off",
+                    )
+            # Update Telegram messages after committing, so the write lock
+            # isn't held across network calls. A few edits run at once so a
+            # backlog of requests doesn't cost one round trip after another.
+            edit_slots = asyncio.Semaphore(MAX_CONCURRENT_EDITS)
+
+            async def defer_message(msg_id: int) -> None:
+                async with edit_slots:
                     await self.notifier.edit_message(
-                        request.telegram_msg_id,
-                        "■ Deferred to CLI prompt",
-                        parse_mode=None,
+                        msg_id, "■ Deferred to CLI prompt", parse_mode=None
                     )
 
+            # Requests are already resolved; a failed edit is only cosmetic
+            # and must not keep AFK mode on
+            await asyncio.gather(
+                *(
+                    defer_message(request.telegram_msg_id)
+                    for request in pending
+                    if request.telegram_msg_id
+                ),
+                return_exceptions=True,
+            )
+
             config.set_mode("off")
 
             if pending_count > 0:
@@ -916,8 +1022,9 @@ class Poller:
                 if elapsed >= timeout:
                     break
 
+                cycle_start = time.monotonic()
                 await self.process_updates_once()
-                await asyncio.sleep(0.5)
+                await sleep_remainder(cycle_start, 0.5)
         finally:
             self._running = False
             await self.lock.release()
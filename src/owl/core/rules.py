@@ -1,15 +1,30 @@
 """Auto-approve rules engine."""
 
+import functools
 import json
 import os
 import re
 from typing import Any, Optional
 
 from owl.core.storage import Storage
+from owl.utils import fastjson
 
 
 MAX_PATTERN_LENGTH = 500  # Limit pattern length to prevent ReDoS attacks
 
+# Glob -> regex translation table: * and ? are wildcards, regex
+# metacharacters are escaped, everything else passes through.
+_GLOB_TO_REGEX = str.maketrans(
+    {"*": ".*", "?": ".", **{c: "\\" + c for c in ".^$+{}[]|()"}}
+)
+
+# Fused alternation regex and the rule rank for each of its groups
+# (re.Pattern or re2 pattern - same match()/lastgroup API)
+_Fused = tuple[Optional[Any], tuple[int, ...]]
+
+# Trie node key holding the entries for rules that end at that node
+_LEAF = ""
+
 
 def normalize_command_for_matching(cmd: str) -> str:
     """Normalize a command string for pattern matching.
@@ -21,6 +36,10 @@ def normalize_command_for_matching(cmd: str) -> str:
 
     This ensures commands match patterns regardless of quoting style.
     """
+    # Without quotes this is a plain whitespace split
+    if '"' not in cmd and "'" not in cmd:
+        return _expand_tilde(cmd.split())
+
     # Use the same smart split logic as CommandParser to handle quotes properly
     tokens = []
     current_token = []
@@ -72,10 +91,14 @@ def normalize_command_for_matching(cmd: str) -> str:
     if current_token:
         tokens.append("".join(current_token))
 
-    # Expand tilde in tokens (for paths like ~/Projects)
-    home = os.path.expanduser("~")
-    tokens = [t.replace("~", home) if t.startswith("~") else t for t in tokens]
+    return _expand_tilde(tokens)
+
 
+def _expand_tilde(tokens: list[str]) -> str:
+    """Expand tilde in tokens (for paths like ~/Projects) and join them."""
+    if any(t.startswith("~") for t in tokens):
+        home = os.path.expanduser("~")
+        tokens = [t.replace("~", home) if t.startswith("~") else t for t in tokens]
     return " ".join(tokens)
 
 
@@ -94,24 +117,230 @@ def matches_pattern(tool_call: str, pattern: str) -> bool:
     if len(pattern) > MAX_PATTERN_LENGTH:
         return False
 
-    # Convert pattern to regex
-    # Escape special regex chars except * and ?
-    regex_pattern = ""
-    i = 0
-    while i < len(pattern):
-        c = pattern[i]
-        if c == "*":
-            regex_pattern += ".*"
-        elif c == "?":
-            regex_pattern += "."
-        elif c in ".^$+{}[]|()":
-            regex_pattern += "\\" + c
-        else:
-            regex_pattern += c
-        i += 1
+    try:
+        regex = _compile_pattern(pattern)
+    except re.error:
+        return False
+    return regex.match(tool_call) is not None
+
+
+def _translate(pattern: str) -> str:
+    """Translate a rule pattern to an (unanchored) regex body."""
+    return pattern.translate(_GLOB_TO_REGEX)
 
-    regex_pattern = "^" + regex_pattern + "$"
-    return bool(re.match(regex_pattern, tool_call, re.IGNORECASE))
+
+def _translate_all(patterns: list[str]) -> list[str]:
+    """Translate many patterns with a single str.translate call."""
+    if not patterns:
+        return []
+    joined = "\0".join(patterns)
+    if joined.count("\0") != len(patterns) - 1:
+        return [_translate(pattern) for pattern in patterns]
+    return joined.translate(_GLOB_TO_REGEX).split("\0")
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a single rule pattern to an anchored, case-insensitive regex."""
+    return re.compile("^" + _translate(pattern) + "$", re.IGNORECASE)
+
+
+def _fuse(bodies: list[tuple[int, str]], use_re2: bool = False) -> _Fused:
+    """Fuse translated patterns into a single alternation regex.
+
+    Each pattern becomes a named group ``r<N>``. Alternation tries branches
+    left to right, so the group that matches is the first (highest priority)
+    pattern that matches - same result as checking them one by one, but in
+    a single ``re.match`` call.
+
+    With use_re2, the regex is compiled with google-re2 when installed
+    (``pip install owl-afk[fast]``): linear-time matching, no backtracking.
+    RE2 keeps the leftmost-branch preference, so the winner is the same.
+    """
+    if not bodies:
+        return (None, ())
+    groups = [f"(?P<r{i}>{body})" for i, (_, body) in enumerate(bodies)]
+    source = "^(?:" + "|".join(groups) + ")$"
+    ranks = tuple(rank for rank, _ in bodies)
+
+    re2 = _re2_module() if use_re2 else None
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        try:
+            return (re2.compile(source, options), ranks)
+        except re2.error:
+            pass  # Fall back to the stdlib engine
+    return (re.compile(source, re.IGNORECASE), ranks)
+
+
+@functools.lru_cache(maxsize=1)
+def _re2_module() -> Any:
+    """google-re2 module, or None if not installed (imported on first use)."""
+    try:
+        import re2
+    except ImportError:
+        return None
+    return re2
+
+
+def _fused_match(fused: _Fused, tool_call: str) -> Optional[int]:
+    """Return the rank of the first fused pattern matching tool_call."""
+    regex, ranks = fused
+    if regex is None:
+        return None
+    match = regex.match(tool_call)
+    if not match or match.lastgroup is None:
+        return None
+    return ranks[int(match.lastgroup[1:])]
+
+
+def _trie_insert(trie: dict[str, Any], key: str, entry: Any) -> None:
+    """Append entry to the trie node reached by walking key."""
+    node = trie
+    for char in key:
+        node = node.setdefault(char, {})
+    node.setdefault(_LEAF, []).append(entry)
+
+
+class _RuleIndex:
+    """Rule set indexed for matching.
+
+    Patterns are classified once, when the rule set is compiled:
+
+    - no wildcard: exact lookup in ``literals``
+    - one ``*`` after a non-empty prefix: walk of ``prefixes``, a char trie
+      on the prefix, then an ``endswith`` check on the rest
+    - one leading ``*``: walk of ``suffixes``, a char trie on the reversed
+      suffix
+    - anything else (``?``, several ``*``, backslashes, non-ASCII): one
+      fused regex over just those patterns
+
+    Every rule keeps its rank (position in priority order). When several
+    rules match, the lowest rank wins - same as checking them one by one.
+    """
+
+    def __init__(self, rules: tuple[tuple[str, str], ...]) -> None:
+        self.actions: list[str] = []
+        self.literals: dict[str, int] = {}
+        self.prefixes: dict[str, Any] = {}
+        self.suffixes: dict[str, Any] = {}
+        self._all: list[tuple[int, str]] = []
+        self._invalid: set[int] = set()
+        self._fallback: Optional[_Fused] = None
+        complex_rules: list[tuple[int, str]] = []
+
+        for pattern, action in rules:
+            if not pattern or len(pattern) > MAX_PATTERN_LENGTH:
+                continue
+            rank = len(self.actions)
+            self.actions.append(action)
+            self._all.append((rank, pattern))
+
+            if (
+                not pattern.isascii()
+                or "?" in pattern
+                or "\\" in pattern
+                or pattern.count("*") > 1
+            ):
+                complex_rules.append((rank, pattern))
+                continue
+
+            key = pattern.lower()
+            if "*" not in key:
+                self.literals.setdefault(key, rank)
+            else:
+                prefix, _, suffix = key.partition("*")
+                if prefix:
+                    _trie_insert(self.prefixes, prefix, (rank, suffix))
+                else:
+                    _trie_insert(self.suffixes, suffix[::-1], rank)
+
+        # Only complex patterns need regexes up front
+        complex_bodies: list[tuple[int, str]] = []
+        bodies = _translate_all([pattern for _, pattern in complex_rules])
+        for (rank, _), body in zip(complex_rules, bodies):
+            try:
+                re.compile(body)
+            except re.error:
+                self._invalid.add(rank)  # Never matched anything, don't break the others
+                continue
+            complex_bodies.append((rank, body))
+        # RE2 only for plain ASCII globs: it rejects some backslash escapes
+        # the stdlib accepts, and case-folds non-ASCII differently
+        self._complex = _fuse(
+            complex_bodies,
+            use_re2=all(
+                p.isascii() and "\\" not in p
+                for r, p in complex_rules
+                if r not in self._invalid
+            ),
+        )
+
+    def match(self, tool_call: str) -> Optional[str]:
+        """Return the action of the highest priority rule matching tool_call."""
+        if not self.actions:
+            return None
+
+        # Case folding and regex "." / "$" only agree with plain string
+        # comparison for single-line ASCII; use the full regex otherwise.
+        if not tool_call.isascii() or "\n" in tool_call:
+            if self._fallback is None:
+                valid = [(r, p) for r, p in self._all if r not in self._invalid]
+                bodies = _translate_all([pattern for _, pattern in valid])
+                self._fallback = _fuse(
+                    [(rank, body) for (rank, _), body in zip(valid, bodies)]
+                )
+            rank = _fused_match(self._fallback, tool_call)
+            return None if rank is None else self.actions[rank]
+
+        call = tool_call.lower()
+        best = self.literals.get(call)
+
+        node: Optional[dict[str, Any]] = self.prefixes
+        depth = 0
+        while node is not None:
+            for rank, suffix in node.get(_LEAF, ()):
+                if (
+                    (best is None or rank < best)
+                    and len(call) - len(suffix) >= depth
+                    and call.endswith(suffix)
+                ):
+                    best = rank
+            if depth == len(call):
+                break
+            node = node.get(call[depth])
+            depth += 1
+
+        node = self.suffixes
+        for char in reversed(call):
+            if node is None:
+                break
+            for rank in node.get(_LEAF, ()):
+                if best is None or rank < best:
+                    best = rank
+            node = node.get(char)
+        if node is not None:
+            for rank in node.get(_LEAF, ()):
+                if best is None or rank < best:
+                    best = rank
+
+        ranks = self._complex[1]
+        if ranks and (best is None or ranks[0] < best):
+            rank = _fused_match(self._complex, tool_call)
+            if rank is not None and (best is None or rank < best):
+                best = rank
+
+        return None if best is None else self.actions[best]
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_rules(rules: tuple[tuple[str, str], ...]) -> _RuleIndex:
+    """Build the match index for a rule set (sorted by priority descending).
+
+    Cached by rule set, so engines sharing the same rules build it once.
+    """
+    return _RuleIndex(rules)
 
 
 def format_tool_call(tool_name: str, tool_input: Optional[str]) -> str:
@@ -128,7 +357,7 @@ def format_tool_call(tool_name: str, tool_input: Optional[str]) -> str:
         return f"{tool_name}()"
 
     try:
-        data = json.loads(tool_input)
+        data = fastjson.loads(tool_input)
     except (json.JSONDecodeError, TypeError):
         return f"{tool_name}()"
 
@@ -155,6 +384,15 @@ class RulesEngine:
 
     def __init__(self, storage: Storage) -> None:
         self.storage = storage
+        self._matcher: Optional[_RuleIndex] = None
+
+    async def _get_matcher(self) -> _RuleIndex:
+        """Load and compile rules once per engine (reset on add/remove)."""
+        if self._matcher is None:
+            # Rules sorted by priority descending
+            rules = await self.storage.get_rules_for_matching()
+            self._matcher = _compile_rules(tuple(rules))
+        return self._matcher
 
     async def check(self, tool_name: str, tool_input: Optional[str] = None) -> Optional[str]:
         """Check if a tool call matches any rule.
@@ -164,14 +402,8 @@ class RulesEngine:
         """
         tool_call = format_tool_call(tool_name, tool_input)
 
-        # Load rules (sorted by priority descending)
-        rules = await self.storage.get_rules_for_matching()
-
-        for pattern, action in rules:
-            if matches_pattern(tool_call, pattern):
-                return action
-
-        return None
+        matcher = await self._get_matcher()
+        return matcher.match(tool_call)
 
     async def add_rule(
         self,
@@ -193,10 +425,12 @@ class RulesEngine:
         if existing:
             return int(existing["id"])  # Return existing rule ID
 
+        self._matcher = None
         return await self.storage.add_rule(pattern, action, priority, created_via)
 
     async def remove_rule(self, rule_id: int) -> bool:
         """Remove a rule by ID."""
+        self._matcher = None
         return await self.storage.remove_rule(rule_id)
 
     async def list_rules(self) -> list[dict[str, Any]]:
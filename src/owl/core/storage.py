@@ -3,14 +3,18 @@
 import json
 import time
 import uuid
+import zlib
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 import aiosqlite
 
+from owl.utils import fastjson
 
-@dataclass
+
+@dataclass(slots=True)
 class Request:
     """Approval request."""
 
@@ -28,7 +32,7 @@ class Request:
     denial_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Claude Code session."""
 
@@ -39,7 +43,7 @@ class Session:
     status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEntry:
     """Audit log entry."""
 
@@ -50,6 +54,14 @@ class AuditEntry:
     details: dict[str, Any]
 
 
+# Column lists in dataclass field order, so rows construct positionally
+_REQUEST_COLUMNS = (
+    "id, session_id, tool_name, tool_input, context, description, status, "
+    "telegram_msg_id, created_at, resolved_at, resolved_by, denial_reason"
+)
+_SESSION_COLUMNS = "session_id, project_path, started_at, last_seen_at, status"
+
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS requests (
     id              TEXT PRIMARY KEY,
@@ -132,15 +144,24 @@ CREATE INDEX IF NOT EXISTS idx_requests_session ON requests(session_id);
 CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log(timestamp);
 CREATE INDEX IF NOT EXISTS idx_pending_messages_session ON pending_messages(session_id);
 CREATE INDEX IF NOT EXISTS idx_subagent_messages_created ON subagent_messages(created_at);
+CREATE INDEX IF NOT EXISTS idx_rules_priority ON auto_approve_rules(priority DESC, id, pattern, action);
 """
 
 
+# Stored in PRAGMA user_version once SCHEMA has been applied. Derived from
+# the schema text, so any schema edit re-runs the (idempotent) script.
+_SCHEMA_VERSION = zlib.crc32(SCHEMA.encode()) & 0x7FFFFFFF
+
+
 class Storage:
     """Async SQLite storage with WAL mode."""
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self._conn: Optional[aiosqlite.Connection] = None
+        self._batch_depth = 0
+        # (data_version, rules) from the last get_rules_for_matching()
+        self._rules_cache: Optional[tuple[int, list[tuple[str, str]]]] = None
 
     @property
     def conn(self) -> aiosqlite.Connection:
@@ -159,18 +180,30 @@ class Storage:
     async def connect(self) -> None:
         """Open database connection."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = await aiosqlite.connect(self.db_path)
+        # sqlite3 keeps prepared statements keyed by SQL text; size the cache
+        # so every statement Storage issues stays prepared for the connection
+        self._conn = await aiosqlite.connect(self.db_path, cached_statements=256)
         self._conn.row_factory = aiosqlite.Row
 
+        # Page size only takes effect on a fresh database, before WAL is enabled
+        await self.conn.execute("PRAGMA page_size=8192")
         # Enable WAL mode for concurrent access
         await self.conn.execute("PRAGMA journal_mode=WAL")
         await self.conn.execute("PRAGMA busy_timeout=5000")
         await self.conn.execute("PRAGMA synchronous=NORMAL")
         await self.conn.execute("PRAGMA temp_store=memory")
+        # Read pages through a memory map and keep up to 64 MiB cached
+        await self.conn.execute("PRAGMA mmap_size=268435456")
+        await self.conn.execute("PRAGMA cache_size=-65536")
 
-        # Create tables
-        await self.conn.executescript(SCHEMA)
-        await self.conn.commit()
+        # Create tables, unless this schema is already in place. Every hook
+        # connects once, so skipping the script saves a write transaction.
+        cursor = await self.conn.execute("PRAGMA user_version")
+        row = await cursor.fetchone()
+        if not row or row[0] != _SCHEMA_VERSION:
+            await self.conn.executescript(SCHEMA)
+            await self.conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            await self.conn.commit()
 
     async def close(self) -> None:
         """Close database connection."""
@@ -180,6 +213,46 @@ class Storage:
             finally:
                 self._conn = None
 
+    async def _commit(self) -> None:
+        """Commit, unless inside batch() (which commits once at the end)."""
+        if self._batch_depth == 0:
+            await self.conn.commit()
+
+    async def _rollback(self) -> None:
+        """Roll back, unless inside batch() (which decides on exit)."""
+        if self._batch_depth == 0:
+            await self.conn.rollback()
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator["Storage"]:
+        """Group several writes into one transaction and a single commit.
+
+        Writes inside the block are committed together on exit, or rolled
+        back if the block raises. Nested batches join the outer one. Keep the
+        block short - it holds the database write lock until it exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                await self.conn.rollback()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            await self.conn.commit()
+
+    async def data_version(self) -> int:
+        """SQLite data_version: changes whenever another connection commits.
+
+        Lets waiters skip re-reading rows while nothing has changed. Commits
+        made through this connection don't move it.
+        """
+        cursor = await self.conn.execute("PRAGMA data_version")
+        row = await cursor.fetchone()
+        return int(row[0]) if row else -1
+
     async def list_tables(self) -> list[str]:
         """List all tables (for testing)."""
         cursor = await self.conn.execute(
@@ -209,18 +282,18 @@ class Storage:
             """,
             (request_id, session_id, tool_name, tool_input, context, description, now),
         )
-        await self.conn.commit()
+        await self._commit()
         return request_id
 
     async def get_request(self, request_id: str) -> Optional[Request]:
         """Get a request by ID."""
         cursor = await self.conn.execute(
-            "SELECT * FROM requests WHERE id = ?", (request_id,)
+            f"SELECT {_REQUEST_COLUMNS} FROM requests WHERE id = ?", (request_id,)
         )
         row = await cursor.fetchone()
         if not row:
             return None
-        return Request(**dict(row))
+        return Request(*row)
 
     async def find_duplicate_pending_request(
         self,
@@ -236,8 +309,8 @@ class Storage:
         """
         min_created_at = time.time() - max_age_seconds
         cursor = await self.conn.execute(
-            """
-            SELECT * FROM requests
+            f"""
+            SELECT {_REQUEST_COLUMNS} FROM requests
             WHERE session_id = ?
               AND tool_name = ?
               AND tool_input IS ?
@@ -251,20 +324,20 @@ class Storage:
         row = await cursor.fetchone()
         if not row:
             return None
-        return Request(**dict(row))
+        return Request(*row)
 
     async def get_request_by_telegram_msg(
         self, telegram_msg_id: int
     ) -> Optional[Request]:
         """Get a request by Telegram message ID."""
         cursor = await self.conn.execute(
-            "SELECT * FROM requests WHERE telegram_msg_id = ? ORDER BY created_at DESC LIMIT 1",
+            f"SELECT {_REQUEST_COLUMNS} FROM requests WHERE telegram_msg_id = ? ORDER BY created_at DESC LIMIT 1",
             (telegram_msg_id,),
         )
         row = await cursor.fetchone()
         if not row:
             return None
-        return Request(**dict(row))
+        return Request(*row)
 
     async def get_latest_resolved_request(
         self, session_id: str, tool_name: Optional[str] = None
@@ -277,8 +350,8 @@ class Storage:
         """
         if tool_name:
             cursor = await self.conn.execute(
-                """
-                SELECT * FROM requests
+                f"""
+                SELECT {_REQUEST_COLUMNS} FROM requests
                 WHERE session_id = ?
                   AND tool_name = ?
                   AND status != 'pending'
@@ -290,8 +363,8 @@ class Storage:
             )
         else:
             cursor = await self.conn.execute(
-                """
-                SELECT * FROM requests
+                f"""
+                SELECT {_REQUEST_COLUMNS} FROM requests
                 WHERE session_id = ?
                   AND status != 'pending'
                   AND telegram_msg_id IS NOT NULL
@@ -303,7 +376,7 @@ class Storage:
         row = await cursor.fetchone()
         if not row:
             return None
-        return Request(**dict(row))
+        return Request(*row)
 
     async def resolve_request(
         self,
@@ -321,15 +394,15 @@ class Storage:
             """,
             (status, now, resolved_by, denial_reason, request_id),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_pending_requests(self) -> list[Request]:
         """Get all pending requests."""
         cursor = await self.conn.execute(
-            "SELECT * FROM requests WHERE status = 'pending' ORDER BY created_at"
+            f"SELECT {_REQUEST_COLUMNS} FROM requests WHERE status = 'pending' ORDER BY created_at"
         )
         rows = await cursor.fetchall()
-        return [Request(**dict(row)) for row in rows]
+        return [Request(*row) for row in rows]
 
     async def set_telegram_msg_id(self, request_id: str, msg_id: int) -> None:
         """Set the Telegram message ID for a request."""
@@ -337,7 +410,7 @@ class Storage:
             "UPDATE requests SET telegram_msg_id = ? WHERE id = ?",
             (msg_id, request_id),
         )
-        await self.conn.commit()
+        await self._commit()
 
     # Pending feedback
 
@@ -351,7 +424,7 @@ class Storage:
             """,
             (prompt_msg_id, request_id, now),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_pending_feedback(self, prompt_msg_id: int) -> Optional[str]:
         """Get request_id for a feedback prompt message."""
@@ -368,7 +441,7 @@ class Storage:
             "DELETE FROM pending_feedback WHERE prompt_msg_id = ?",
             (prompt_msg_id,),
         )
-        await self.conn.commit()
+        await self._commit()
 
     # Pending subagent responses
 
@@ -384,7 +457,7 @@ class Storage:
             """,
             (subagent_id, telegram_msg_id, now),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_pending_subagent(self, subagent_id: str) -> Optional[dict[str, Any]]:
         """Get pending subagent entry."""
@@ -414,7 +487,7 @@ class Storage:
             "UPDATE pending_subagent SET status = ?, response = ? WHERE subagent_id = ?",
             (status, response, subagent_id),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def set_subagent_continue_prompt(
         self, subagent_id: str, prompt_msg_id: int
@@ -427,7 +500,7 @@ class Storage:
             """,
             (prompt_msg_id, f"subagent:{subagent_id}", time.time()),
         )
-        await self.conn.commit()
+        await self._commit()
 
     # Subagent message auto-dismiss tracking
 
@@ -437,7 +510,7 @@ class Storage:
             "INSERT OR REPLACE INTO subagent_messages (msg_id, compact_text, created_at) VALUES (?, ?, ?)",
             (msg_id, compact_text, time.time()),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_expired_subagent_messages(
         self, max_age_seconds: int
@@ -460,7 +533,17 @@ class Storage:
             "DELETE FROM subagent_messages WHERE msg_id = ?",
             (msg_id,),
         )
-        await self.conn.commit()
+        await self._commit()
+
+    async def delete_subagent_messages(self, msg_ids: list[int]) -> None:
+        """Delete several subagent messages from tracking in one commit."""
+        if not msg_ids:
+            return
+        await self.conn.executemany(
+            "DELETE FROM subagent_messages WHERE msg_id = ?",
+            [(msg_id,) for msg_id in msg_ids],
+        )
+        await self._commit()
 
     # Pending stop (main agent stop approval)
 
@@ -476,7 +559,7 @@ class Storage:
             """,
             (session_id, telegram_msg_id, now),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_pending_stop(self, session_id: str) -> Optional[dict[str, Any]]:
         """Get pending stop entry."""
@@ -503,7 +586,7 @@ class Storage:
             "UPDATE pending_stop SET status = ?, response = ? WHERE session_id = ?",
             (status, response, session_id),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def set_stop_comment_prompt(
         self, session_id: str, prompt_msg_id: int
@@ -516,7 +599,7 @@ class Storage:
             """,
             (prompt_msg_id, f"stop:{session_id}", time.time()),
         )
-        await self.conn.commit()
+        await self._commit()
 
     # Sessions
 
@@ -537,25 +620,25 @@ class Storage:
             """,
             (session_id, project_path, now, now, now, project_path),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_session(self, session_id: str) -> Optional[Session]:
         """Get a session by ID."""
         cursor = await self.conn.execute(
-            "SELECT * FROM sessions WHERE session_id = ?", (session_id,)
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE session_id = ?", (session_id,)
         )
         row = await cursor.fetchone()
         if not row:
             return None
-        return Session(**dict(row))
+        return Session(*row)
 
     async def get_active_sessions(self) -> list[Session]:
         """Get all active sessions."""
         cursor = await self.conn.execute(
-            "SELECT * FROM sessions WHERE status = 'active' ORDER BY last_seen_at DESC"
+            f"SELECT {_SESSION_COLUMNS} FROM sessions WHERE status = 'active' ORDER BY last_seen_at DESC"
         )
         rows = await cursor.fetchall()
-        return [Session(**dict(row)) for row in rows]
+        return [Session(*row) for row in rows]
 
     # Audit log
 
@@ -575,20 +658,27 @@ class Storage:
             """,
             (now, event_type, session_id, details_json),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_audit_log(self, limit: int = 100) -> list[AuditEntry]:
         """Get recent audit log entries."""
         cursor = await self.conn.execute(
-            "SELECT * FROM audit_log ORDER BY timestamp DESC LIMIT ?", (limit,)
+            "SELECT id, timestamp, event_type, session_id, details FROM audit_log "
+            "ORDER BY timestamp DESC LIMIT ?",
+            (limit,),
         )
         rows = await cursor.fetchall()
-        entries = []
-        for row in rows:
-            d = dict(row)
-            d["details"] = json.loads(d["details"]) if d["details"] else {}
-            entries.append(AuditEntry(**d))
-        return entries
+        loads = fastjson.loads
+        return [
+            AuditEntry(
+                entry_id,
+                timestamp,
+                event_type,
+                session_id,
+                loads(details) if details else {},
+            )
+            for entry_id, timestamp, event_type, session_id, details in rows
+        ]
 
     # Pending messages for /msg command
     async def add_pending_message(self, session_id: str, message: str) -> None:
@@ -633,7 +723,7 @@ class Storage:
             """,
             (session_id, message, now),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def get_pending_messages(self, session_id: str) -> list[tuple[int, str]]:
         """Get pending messages for a session.
@@ -656,7 +746,38 @@ class Storage:
             "UPDATE pending_messages SET delivered_at = ? WHERE id = ?",
             (time.time(), message_id),
         )
-        await self.conn.commit()
+        await self._commit()
+
+    async def mark_messages_delivered(self, message_ids: list[int]) -> None:
+        """Mark several messages as delivered in one commit."""
+        if not message_ids:
+            return
+        now = time.time()
+        # Older SQLite builds cap bound parameters at 999 per statement
+        for start in range(0, len(message_ids), 512):
+            chunk = message_ids[start : start + 512]
+            # Pad to a power of two by repeating the last id (harmless in
+            # IN), so the statement cache holds a few texts, not one per size
+            size = 1 << (len(chunk) - 1).bit_length()
+            chunk += chunk[-1:] * (size - len(chunk))
+            await self.conn.execute(
+                "UPDATE pending_messages SET delivered_at = ? "
+                f"WHERE id IN ({','.join('?' * size)})",
+                (now, *chunk),
+            )
+        await self._commit()
+
+    async def take_pending_messages(self, session_id: str) -> list[str]:
+        """Return a session's undelivered messages and mark them delivered.
+
+        Messages come back oldest first.
+        """
+        pending = await self.get_pending_messages(session_id)
+        if not pending:
+            return []
+        message_ids, texts = zip(*pending)
+        await self.mark_messages_delivered(list(message_ids))
+        return list(texts)
 
     # Chain state (stored in pending_feedback table)
 
@@ -684,7 +805,7 @@ class Storage:
             """,
             (msg_id, state_json, time.time()),
         )
-        await self.conn.commit()
+        await self._commit()
 
     async def save_chain_state_atomic(
         self, msg_id: int, state_json: str, expected_version: int
@@ -714,9 +835,9 @@ class Storage:
                 )
             except Exception:
                 # Insert failed (probably exists with different version)
-                await self.conn.rollback()
+                await self._rollback()
                 return False
-        await self.conn.commit()
+        await self._commit()
         return True
 
     async def clear_chain_state(self, msg_id: int) -> None:
@@ -725,7 +846,7 @@ class Storage:
             "DELETE FROM pending_feedback WHERE prompt_msg_id = ?",
             (msg_id,),
         )
-        await self.conn.commit()
+        await self._commit()
 
     # Auto-approve rules
 
@@ -738,12 +859,25 @@ class Storage:
         return [dict(row) for row in rows]
 
     async def get_rules_for_matching(self) -> list[tuple[str, str]]:
-        """Get rules for pattern matching (pattern, action tuples)."""
+        """Get rules for pattern matching (pattern, action tuples).
+
+        Served straight from idx_rules_priority (no sort, no table lookup).
+        The result is reused until the database changes: PRAGMA data_version
+        moves whenever another connection commits, and add_rule/remove_rule
+        drop it for this one. Long-lived processes (the poller) build
+        engines per callback, so this keeps their rules warm.
+        """
+        data_version = await self.data_version()
+        if self._rules_cache is not None and self._rules_cache[0] == data_version:
+            return list(self._rules_cache[1])
+
         cursor = await self.conn.execute(
-            "SELECT pattern, action FROM auto_approve_rules ORDER BY priority DESC"
+            "SELECT pattern, action FROM auto_approve_rules ORDER BY priority DESC, id"
         )
         rows = await cursor.fetchall()
-        return [(row["pattern"], row["action"]) for row in rows]
+        rules = [(row["pattern"], row["action"]) for row in rows]
+        self._rules_cache = (data_version, rules)
+        return list(rules)
 
     async def get_rule_by_pattern(
         self, pattern: str, action: str
@@ -764,6 +898,7 @@ class Storage:
         created_via: str,
     ) -> int:
         """Add a new rule. Returns rule ID."""
+        self._rules_cache = None
         cursor = await self.conn.execute(
             """
             INSERT INTO auto_approve_rules (pattern, action, priority, created_via, created_at)
@@ -771,14 +906,15 @@ class Storage:
             """,
             (pattern, action, priority, created_via, time.time()),
         )
-        await self.conn.commit()
+        await self._commit()
         assert cursor.lastrowid is not None, "INSERT should return lastrowid"
         return cursor.lastrowid
 
     async def remove_rule(self, rule_id: int) -> bool:
         """Remove a rule by ID. Returns True if deleted."""
+        self._rules_cache = None
         cursor = await self.conn.execute(
             "DELETE FROM auto_approve_rules WHERE id = ?", (rule_id,)
         )
-        await self.conn.commit()
+        await self._commit()
         return cursor.rowcount > 0
@@ -14,12 +14,24 @@ class FastPathResult(Enum):
     FALLBACK = "fallback"  # Return empty {} to use Claude's CLI
 
 
+# Last result per mode file, keyed by (inode, mtime_ns, size) at read time
+_MODE_RESULTS: dict[bytes, tuple[tuple[int, int, int], FastPathResult]] = {}
+
+# Resolved mode file path per OWL_DIR value (None = default location)
+_MODE_PATHS: dict[Optional[str], bytes] = {}
+
+# Precomputed hook responses, written straight to fd 1
+_APPROVE_JSON = b'{"decision": "approve"}\n'
+_DENY_JSON = b'{"decision": "deny"}\n'
+
+
 def check_fast_path(owl_dir: Optional[Path] = None) -> FastPathResult:
     """Check if we can fast-path without loading heavy modules.
 
     This function is designed to be as fast as possible:
     - No imports beyond stdlib
-    - Single file read
+    - Single raw read of the mode file, compared as bytes (no decoding)
+    - Repeat calls in one process only stat() the file while it is unchanged
     - No exception handling overhead for common case
 
     Args:
@@ -30,46 +42,77 @@ def check_fast_path(owl_dir: Optional[Path] = None) -> FastPathResult:
         FastPathResult indicating whether to approve, deny, or continue
     """
     if owl_dir is None:
-        env_dir = os.environ.get("OWL_DIR")
-        if env_dir:
-            owl_dir = Path(env_dir)
-        else:
-            owl_dir = Path.home() / ".config" / "owl"
-
-    mode_file = owl_dir / "mode"
+        mode_path = _default_mode_path()
+    else:
+        mode_path = os.fsencode(owl_dir / "mode")
 
     try:
-        mode = mode_file.read_text().strip()
+        st = os.stat(mode_path)
     except FileNotFoundError:
         return FastPathResult.APPROVE
     except Exception:
         return FastPathResult.CONTINUE
 
-    if mode == "off":
-        return FastPathResult.FALLBACK  # Fall back to Claude's CLI approval
-    elif mode == "on":
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _MODE_RESULTS.get(mode_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        fd = os.open(mode_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return FastPathResult.APPROVE
+    except Exception:
         return FastPathResult.CONTINUE
-    else:
+    try:
+        mode = os.read(fd, 64).strip()
+    except Exception:
         return FastPathResult.CONTINUE
+    finally:
+        os.close(fd)
+
+    if mode == b"off":
+        result = FastPathResult.FALLBACK  # Fall back to Claude's CLI approval
+    elif mode == b"on":
+        result = FastPathResult.CONTINUE
+    else:
+        result = FastPathResult.CONTINUE
+    _MODE_RESULTS[mode_path] = (stamp, result)
+    return result
+
 
+def _default_mode_path() -> bytes:
+    """Mode file path from OWL_DIR or ~/.config/owl, resolved once."""
+    env_dir = os.environ.get("OWL_DIR") or None
+    mode_path = _MODE_PATHS.get(env_dir)
+    if mode_path is None:
+        if env_dir:
+            owl_dir = Path(env_dir)
+        else:
+            owl_dir = Path.home() / ".config" / "owl"
+        mode_path = _MODE_PATHS[env_dir] = os.fsencode(owl_dir / "mode")
+    return mode_path
 
-def fast_path_main():
+
+def fast_path_main() -> None:
     """Entry point for fast path check only.
 
+    Writes the response with os.write and leaves with os._exit: nothing
+    else has been imported or buffered, so stdout encoding and interpreter
+    teardown would be pure overhead.
+
     Exit codes:
         0 = approve (fast path)
         1 = deny (fast path)
         2 = continue to full check
     """
-    import sys
-
     result = check_fast_path()
 
     if result == FastPathResult.APPROVE:
-        print('{"decision": "approve"}')
-        sys.exit(0)
+        os.write(1, _APPROVE_JSON)
+        os._exit(0)
     elif result == FastPathResult.DENY:
-        print('{"decision": "deny"}')
-        sys.exit(1)
+        os.write(1, _DENY_JSON)
+        os._exit(1)
     else:
-        sys.exit(2)
+        os._exit(2)
@@ -1,11 +1,11 @@
 """PreCompact hook handler - notify on context compaction."""
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-from owl.notifiers.telegram import TelegramNotifier
-from owl.utils.config import Config, get_owl_dir
+from owl.utils.config import get_config, get_owl_dir
 
 
 async def handle_pre_compact(
@@ -24,7 +24,7 @@ async def handle_pre_compact(
     if owl_dir is None:
         owl_dir = get_owl_dir()
 
-    config = Config(owl_dir)
+    config = get_config(owl_dir)
     cwd = hook_input.get("cwd", "")
 
     # Only notify if owl is enabled for this project and Telegram is configured
@@ -38,7 +38,10 @@ async def handle_pre_compact(
     session_id = hook_input.get("session_id", "unknown")
 
     # Format project name from cwd
-    project_name = Path(cwd).name if cwd else "unknown"
+    project_name = os.path.basename(cwd.rstrip("/")) if cwd else "unknown"
+
+    # Deferred: httpx is only needed once we actually notify
+    from owl.notifiers.telegram import TelegramNotifier
 
     # Send notification
     notifier = TelegramNotifier(
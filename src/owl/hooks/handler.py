@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 from owl.fast_path import FastPathResult, check_fast_path
+from owl.hooks.response import write_response
 
 
 async def handle_hook(
@@ -51,7 +52,7 @@ async def handle_hook(
         return {"error": f"Unknown hook type: {hook_type}"}
 
 
-def main():
+def main() -> None:
     """CLI entry point for hooks."""
     import asyncio
 
@@ -59,7 +60,7 @@ def main():
     from owl.utils.debug import log_error
 
     if len(sys.argv) < 3 or sys.argv[1] != "hook":
-        print(json.dumps({"error": "Usage: owl hook <HookType>"}))
+        write_response({"error": "Usage: owl hook <HookType>"})
         sys.exit(1)
 
     hook_type = sys.argv[2]
@@ -68,27 +69,27 @@ def main():
     # Fast path check first
     result = check_fast_path(owl_dir)
     if result == FastPathResult.APPROVE:
-        print(json.dumps({"decision": "approve"}))
+        write_response({"decision": "approve"})
         sys.exit(0)
     elif result == FastPathResult.DENY:
-        print(json.dumps({"decision": "deny"}))
+        write_response({"decision": "deny"})
         sys.exit(0)
     elif result == FastPathResult.FALLBACK:
         # Return empty to fall back to Claude's CLI approval
-        print(json.dumps({}))
+        write_response({})
         sys.exit(0)
 
     # Read stdin
     try:
         hook_input = json.load(sys.stdin)
     except json.JSONDecodeError:
-        print(json.dumps({"error": "Invalid JSON input"}))
+        write_response({"error": "Invalid JSON input"})
         sys.exit(1)
 
     # Run async handler with error logging
     try:
         response = asyncio.run(handle_hook(hook_type, hook_input, owl_dir))
-        print(json.dumps(response))
+        write_response(response)
     except Exception as e:
         # Log the full error with traceback (always, even if debug is off)
         log_error(
@@ -97,4 +98,4 @@ def main():
             exc=e,
         )
         # Return empty dict to gracefully fall back to CLI approval
-        print(json.dumps({}))
+        write_response({})
@@ -1,10 +1,9 @@
 """PermissionRequest hook handler."""
 
-import json
 from pathlib import Path
 from typing import Optional
 
-from owl.hooks.response import make_hook_response
+from owl.hooks.response import fast_response, make_hook_response
 
 
 async def handle_permission_request(
@@ -23,25 +22,34 @@ async def handle_permission_request(
     Returns:
         Response dict with hookSpecificOutput for Claude Code
     """
-    import sys
-
-    from owl.core.manager import ApprovalManager
+    # Only the fast path check is imported up front, so approve-all and
+    # mode-off answers never load the manager (aiosqlite, httpx)
     from owl.fast_path import FastPathResult, check_fast_path
-    from owl.utils.config import Config
 
     fast_result = check_fast_path(owl_dir)
     if fast_result == FastPathResult.APPROVE:
-        return make_hook_response(
-            "PermissionRequest", decision="allow", reason="owl fast path: approve all"
-        )
+        return fast_response("PermissionRequest", "allow")
     elif fast_result == FastPathResult.DENY:
-        return make_hook_response(
-            "PermissionRequest", decision="deny", reason="owl fast path: deny all"
-        )
+        return fast_response("PermissionRequest", "deny")
     elif fast_result == FastPathResult.FALLBACK:
         return {}  # Fall back to Claude's CLI approval
 
     tool_name = hook_input.get("tool_name", "Unknown")
+
+    from owl.utils.config import get_config
+
+    project_path = hook_input.get("cwd")
+
+    # Load config and check if enabled for this project, before doing any
+    # per-request work (stderr logging, serializing tool_input)
+    config = get_config(owl_dir)
+    if not config.is_enabled_for_project(project_path):
+        return {}  # Fall back to CLI approval
+
+    import sys
+
+    from owl.utils import fastjson
+
     tool_input = hook_input.get("tool_input")
 
     try:
@@ -52,17 +60,12 @@ async def handle_permission_request(
 
     if isinstance(tool_input, dict):
         description = tool_input.get("description")
-        tool_input_str = json.dumps(tool_input)
+        tool_input_str = fastjson.dumps(tool_input)
     else:
         description = None
         tool_input_str = str(tool_input) if tool_input else None
 
-    project_path = hook_input.get("cwd")
-
-    # Load config and check if enabled for this project
-    config = Config(owl_dir)
-    if not config.is_enabled_for_project(project_path):
-        return {}  # Fall back to CLI approval
+    from owl.core.manager import ApprovalManager
 
     manager = ApprovalManager(
         owl_dir=owl_dir,
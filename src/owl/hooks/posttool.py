@@ -1,14 +1,16 @@
 """PostToolUse hook handler - delivers pending messages and tool results."""
 
-import json
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from owl.core.storage import Storage
 from owl.hooks.response import make_hook_response
-from owl.utils.config import Config, get_owl_dir
+from owl.utils import fastjson
+from owl.utils.config import Config, get_config, get_owl_dir
 from owl.utils.debug import debug
 
+if TYPE_CHECKING:
+    from owl.core.storage import Storage
+
 
 async def handle_posttool_use(
     hook_input: dict,
@@ -20,12 +22,14 @@ async def handle_posttool_use(
     if owl_dir is None:
         owl_dir = get_owl_dir()
 
-    config = Config(owl_dir)
+    config = get_config(owl_dir)
     project_path = hook_input.get("cwd")
 
     if not config.is_enabled_for_project(project_path):
         return {}
 
+    from owl.core.storage import Storage
+
     storage = Storage(config.db_path)
 
     try:
@@ -39,25 +43,22 @@ async def handle_posttool_use(
             await _maybe_edit_with_result(config, storage, hook_input, session_id)
 
         # Check for pending messages from /msg command
-        pending = await storage.get_pending_messages(session_id)
-        debug("posttool", f"pending_messages={len(pending) if pending else 0}")
+        texts = await storage.take_pending_messages(session_id)
+        debug("posttool", f"pending_messages={len(texts)}")
 
-        if not pending:
+        if not texts:
             return {}
 
-        messages = []
-        for msg_id, msg_text in pending:
-            messages.append(f"- {msg_text}")
-            await storage.mark_message_delivered(msg_id)
+        for msg_text in texts:
             debug("posttool", f"Delivering: {msg_text[:50]}")
 
         additional_context = (
             "The user sent you a message via remote approval:\n"
-            + "\n".join(messages)
+            + "\n".join(f"- {msg_text}" for msg_text in texts)
         )
 
         try:
-            print(f"[owl] Delivering {len(pending)} pending message(s)", file=sys.stderr)
+            print(f"[owl] Delivering {len(texts)} pending message(s)", file=sys.stderr)
         except BrokenPipeError:
             pass
 
@@ -69,7 +70,7 @@ async def handle_posttool_use(
 
 async def _maybe_edit_with_result(
     config: Config,
-    storage: Storage,
+    storage: "Storage",
     hook_input: dict,
     session_id: str,
 ) -> None:
@@ -99,7 +100,7 @@ async def _maybe_edit_with_result(
         return
 
     tool_input = hook_input.get("tool_input")
-    tool_input_str = json.dumps(tool_input) if isinstance(tool_input, dict) else str(tool_input or "")
+    tool_input_str = fastjson.dumps(tool_input) if isinstance(tool_input, dict) else str(tool_input or "")
 
     result_html = format_tool_result(tool_name, tool_input_str, tool_response)
     if not result_html:
@@ -1,13 +1,10 @@
 """PreToolUse hook handler."""
 
-import json
 from pathlib import Path
 from typing import Optional
 
-from owl.core.manager import ApprovalManager
 from owl.fast_path import FastPathResult, check_fast_path
-from owl.hooks.response import make_hook_response
-from owl.utils.config import Config
+from owl.hooks.response import fast_response, make_hook_response
 
 
 async def handle_pretool_use(
@@ -24,8 +21,6 @@ async def handle_pretool_use(
     Returns:
         Response dict with hookSpecificOutput for Claude Code
     """
-    import sys
-
     from owl.utils.debug import debug_hook
 
     tool_name = hook_input.get("tool_name", "Unknown")
@@ -36,34 +31,15 @@ async def handle_pretool_use(
     fast_result = check_fast_path(owl_dir)
     if fast_result == FastPathResult.APPROVE:
         debug_hook("fast path approve", tool_name=tool_name)
-        return make_hook_response(
-            "PreToolUse", decision="allow", reason="owl fast path: approve all"
-        )
+        return fast_response("PreToolUse", "allow")
     elif fast_result == FastPathResult.DENY:
         debug_hook("fast path deny", tool_name=tool_name)
-        return make_hook_response(
-            "PreToolUse", decision="deny", reason="owl fast path: deny all"
-        )
+        return fast_response("PreToolUse", "deny")
     elif fast_result == FastPathResult.FALLBACK:
         debug_hook("fast path fallback (mode off)", tool_name=tool_name)
         return {}  # Fall back to Claude's CLI approval
 
-    tool_input = hook_input.get("tool_input")
-
-    # Debug: log to stderr what we're processing
-    try:
-        print(f"[owl] Processing: {tool_name}", file=sys.stderr)
-    except BrokenPipeError:
-        pass  # Parent process closed stderr, continue silently
-    session_id = hook_input.get("session_id", "unknown")
-    context = hook_input.get("tool_context")
-
-    if isinstance(tool_input, dict):
-        description = tool_input.get("description")
-        tool_input_str = json.dumps(tool_input)
-    else:
-        description = None
-        tool_input_str = str(tool_input) if tool_input else None
+    from owl.utils.config import get_config
 
     # Try multiple field names for project path
     project_path = (
@@ -73,8 +49,9 @@ async def handle_pretool_use(
         or hook_input.get("workingDirectory")
     )
 
-    # Load config and check if enabled for this project
-    config = Config(owl_dir)
+    # Load config and check if enabled for this project, before doing any
+    # per-request work (stderr logging, serializing tool_input)
+    config = get_config(owl_dir)
     if not config.is_enabled_for_project(project_path):
         debug_hook(
             "project not enabled, fallback to CLI",
@@ -84,6 +61,30 @@ async def handle_pretool_use(
         )
         return {}  # Fall back to CLI approval
 
+    import sys
+
+    from owl.utils import fastjson
+
+    tool_input = hook_input.get("tool_input")
+
+    # Debug: log to stderr what we're processing
+    try:
+        print(f"[owl] Processing: {tool_name}", file=sys.stderr)
+    except BrokenPipeError:
+        pass  # Parent process closed stderr, continue silently
+    session_id = hook_input.get("session_id", "unknown")
+    context = hook_input.get("tool_context")
+
+    if isinstance(tool_input, dict):
+        description = tool_input.get("description")
+        tool_input_str = fastjson.dumps(tool_input)
+    else:
+        description = None
+        tool_input_str = str(tool_input) if tool_input else None
+
+    # Deferred: aiosqlite/httpx only load once a request actually needs them
+    from owl.core.manager import ApprovalManager
+
     manager = ApprovalManager(
         owl_dir=owl_dir,
         timeout=config.timeout_seconds,
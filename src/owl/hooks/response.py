@@ -1,5 +1,6 @@
 """Unified hook response helpers."""
 
+import sys
 from typing import Optional
 
 
@@ -34,3 +35,64 @@ def make_hook_response(
         output["hookSpecificOutput"]["additionalContext"] = additional_context
 
     return output
+
+
+def make_block_response(hook_event: str, reason: str) -> dict:
+    """Build a response that keeps Claude going from a Stop/SubagentStop hook.
+
+    The block decision is given both top-level and under hookSpecificOutput,
+    for compatibility with Claude Code versions that read either.
+
+    Args:
+        hook_event: "Stop" or "SubagentStop"
+        reason: Message delivered to Claude as the reason to continue
+
+    Returns:
+        Response dict ready for JSON serialization.
+    """
+    return {
+        "decision": "block",
+        "reason": reason,
+        "hookSpecificOutput": {
+            "hookEventName": hook_event,
+            "decision": "block",
+            "reason": reason,
+        },
+    }
+
+
+# Fast path answers never vary, so build them once at import. Shared
+# instances: callers serialize them and must not mutate them.
+_FAST_RESPONSES: dict[tuple[str, str], dict] = {
+    (event, decision): make_hook_response(
+        event, decision=decision, reason=f"owl fast path: {label}"
+    )
+    for event in ("PreToolUse", "PermissionRequest")
+    for decision, label in (("allow", "approve all"), ("deny", "deny all"))
+}
+
+
+def fast_response(hook_event: str, decision: str) -> dict:
+    """Return the prebuilt fast path response for an event and decision.
+
+    Args:
+        hook_event: "PreToolUse" or "PermissionRequest"
+        decision: "allow" or "deny"
+
+    Returns:
+        Shared response dict; do not mutate it.
+    """
+    return _FAST_RESPONSES[(hook_event, decision)]
+
+
+def write_response(response: dict) -> None:
+    """Write a hook response to stdout as one JSON line.
+
+    Encodes straight to bytes and writes them to the binary buffer, skipping
+    print's str building and text-layer encoding.
+    """
+    from owl.utils import fastjson
+
+    sys.stdout.flush()  # keep ordering with anything already printed
+    sys.stdout.buffer.write(fastjson.dumps_line(response))
+    sys.stdout.buffer.flush()
@@ -6,6 +6,7 @@ import sys
 from typing import Any, Awaitable, Callable
 
 from owl.fast_path import FastPathResult, check_fast_path
+from owl.hooks.response import write_response
 
 
 def run_hook(handler: Callable[[dict], Awaitable[dict[str, Any]]]) -> int:
@@ -26,15 +27,15 @@ def run_hook(handler: Callable[[dict], Awaitable[dict[str, Any]]]) -> int:
     debug_hook("runner fast_path check", result=result.value)
 
     if result == FastPathResult.APPROVE:
-        print(json.dumps({"decision": "approve"}))
+        write_response({"decision": "approve"})
         return 0
     elif result == FastPathResult.DENY:
-        print(json.dumps({"decision": "deny"}))
+        write_response({"decision": "deny"})
         return 0
     elif result == FastPathResult.FALLBACK:
         # Return empty to fall back to Claude's CLI approval
         debug_hook("runner fallback - handler not called")
-        print(json.dumps({}))
+        write_response({})
         return 0
 
     # Read stdin
@@ -45,5 +46,5 @@ def run_hook(handler: Callable[[dict], Awaitable[dict[str, Any]]]) -> int:
 
     # Run async handler
     response = asyncio.run(handler(hook_input))
-    print(json.dumps(response))
+    write_response(response)
     return 0
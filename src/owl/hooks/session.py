@@ -1,11 +1,19 @@
 """Session hook handlers - SessionStart and SessionEnd."""
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-from owl.notifiers.telegram import TelegramNotifier
-from owl.utils.config import Config, get_owl_dir
+from owl.utils.config import get_config, get_owl_dir
+
+# Icon shown in the SessionEnd notification, by end reason
+_REASON_ICONS = {
+    "clear": "×",
+    "logout": "—",
+    "prompt_input_exit": "■",
+    "other": "—",
+}
 
 
 async def handle_session_start(
@@ -42,7 +50,7 @@ async def handle_session_end(
     if owl_dir is None:
         owl_dir = get_owl_dir()
 
-    config = Config(owl_dir)
+    config = get_config(owl_dir)
     cwd = hook_input.get("cwd", "")
 
     # Only notify if owl is enabled for this project and Telegram is configured
@@ -56,7 +64,10 @@ async def handle_session_end(
     session_id = hook_input.get("session_id", "unknown")
 
     # Format project name from cwd
-    project_name = Path(cwd).name if cwd else "unknown"
+    project_name = os.path.basename(cwd.rstrip("/")) if cwd else "unknown"
+
+    # Deferred: httpx is only needed once we actually notify
+    from owl.notifiers.telegram import TelegramNotifier
 
     # Send notification
     notifier = TelegramNotifier(
@@ -64,13 +75,7 @@ async def handle_session_end(
         chat_id=config.telegram_chat_id,
     )
 
-    reason_icon = {
-        "clear": "×",
-        "logout": "—",
-        "prompt_input_exit": "■",
-        "other": "—",
-    }
-    icon = reason_icon.get(reason, "—")
+    icon = _REASON_ICONS.get(reason, "—")
 
     message = f"{icon} <b>Session ended</b> ({reason})\n<i>{project_name}</i> ({session_id[:8]})"
 
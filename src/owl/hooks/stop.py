@@ -1,13 +1,10 @@
 """Stop hook handler - interactive approval before Claude stops."""
 
-import asyncio
-import time
 from pathlib import Path
 from typing import Optional
 
-from owl.core.storage import Storage
-from owl.notifiers.telegram import TelegramNotifier
-from owl.utils.config import Config, get_owl_dir
+from owl.hooks.response import make_block_response
+from owl.utils.config import get_config, get_owl_dir
 
 
 async def handle_stop(
@@ -25,7 +22,7 @@ async def handle_stop(
     if owl_dir is None:
         owl_dir = get_owl_dir()
 
-    config = Config(owl_dir)
+    config = get_config(owl_dir)
     project_path = hook_input.get("cwd")
 
     # Pass through when mode is off, project not enabled, or hook is disabled
@@ -38,33 +35,23 @@ async def handle_stop(
 
     session_id = hook_input.get("session_id", "unknown")
 
+    # Deferred: aiosqlite/httpx are only needed once the hook is active
+    from owl.core.storage import Storage
+    from owl.notifiers.telegram import TelegramNotifier
+
     storage = Storage(config.db_path)
     try:
         await storage.connect()
 
         # First check for already-pending messages (from /msg)
-        pending = await storage.get_pending_messages(session_id)
-        if pending:
-            messages = []
-            for msg_id, msg_text in pending:
-                messages.append(f"- {msg_text}")
-                await storage.mark_message_delivered(msg_id)
-
+        texts = await storage.take_pending_messages(session_id)
+        if texts:
             reason = (
                 "The user sent you a message via remote approval:\n"
-                + "\n".join(messages)
+                + "\n".join(f"- {msg_text}" for msg_text in texts)
                 + "\n\nPlease address this before stopping."
             )
-            # Include both formats for compatibility with Claude Code
-            return {
-                "decision": "block",
-                "reason": reason,
-                "hookSpecificOutput": {
-                    "hookEventName": "Stop",
-                    "decision": "block",
-                    "reason": reason,
-                },
-            }
+            return make_block_response("Stop", reason)
 
         # No pending messages - send interactive notification
         notifier = TelegramNotifier(
@@ -80,52 +67,31 @@ async def handle_stop(
         # Create pending stop entry
         await storage.create_pending_stop(session_id, msg_id)
 
-        # Poll for response
-        from owl.core.poller import Poller
+        # Wait for a response
+        from owl.core.poller import Poller, wait_until_resolved
 
         poller = Poller(storage, notifier, owl_dir)
 
-        timeout = 3600  # 1 hour
-        start = time.monotonic()
-
         try:
-            while True:
-                elapsed = time.monotonic() - start
-                if elapsed >= timeout:
-                    # Timeout - let Claude stop
-                    return {}
-
-                # Poll for updates
-                try:
-                    await poller.process_updates_once()
-                except Exception:
-                    pass
-
-                # Check status
-                entry = await storage.get_pending_stop(session_id)
-                if entry and entry["status"] != "pending":
-                    if entry["status"] == "comment" and entry["response"]:
-                        # User sent a comment - block and deliver
-                        reason = (
-                            "The user sent you a message via remote approval:\n"
-                            f"- {entry['response']}\n\n"
-                            "Please address this before stopping."
-                        )
-                        # Include both formats for compatibility with Claude Code
-                        return {
-                            "decision": "block",
-                            "reason": reason,
-                            "hookSpecificOutput": {
-                                "hookEventName": "Stop",
-                                "decision": "block",
-                                "reason": reason,
-                            },
-                        }
-                    else:
-                        # OK - let Claude stop
-                        return {}
-
-                await asyncio.sleep(0.5)
+            entry = await wait_until_resolved(
+                poller,
+                lambda: storage.get_pending_stop(session_id),
+                timeout=3600,  # 1 hour
+            )
+            if entry is None:
+                # Timeout - let Claude stop
+                return {}
+
+            if entry["status"] == "comment" and entry["response"]:
+                # User sent a comment - block and deliver
+                reason = (
+                    "The user sent you a message via remote approval:\n"
+                    f"- {entry['response']}\n\n"
+                    "Please address this before stopping."
+                )
+                return make_block_response("Stop", reason)
+            # OK - let Claude stop
+            return {}
         finally:
             await notifier.close()
 
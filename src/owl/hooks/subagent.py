@@ -2,18 +2,30 @@
 
 import asyncio
 import json
+import os
+import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from owl.core.storage import Storage
-from owl.notifiers.telegram import TelegramNotifier
-from owl.utils.config import Config
+from owl.hooks.response import make_block_response
+from owl.utils import fastjson
+from owl.utils.config import get_config, get_owl_dir
+from owl.utils.constants import MAX_CONCURRENT_EDITS
+from owl.utils.debug import append_log
+
+if TYPE_CHECKING:
+    from owl.core.storage import Storage
+    from owl.notifiers.telegram import TelegramNotifier
+
+# How far into a transcript (from the head or the tail) the extractors look
+# before giving up, so a runaway log can't stall the hook
+_TRANSCRIPT_SCAN_LIMIT = 4 * 1024 * 1024
 
 
 async def _lazy_cleanup_subagent_messages(
-    storage: Storage,
-    notifier: TelegramNotifier,
+    storage: "Storage",
+    notifier: "TelegramNotifier",
     max_age_seconds: int,
 ) -> int:
     """Clean up expired subagent messages (auto-dismiss).
@@ -21,65 +33,89 @@ async def _lazy_cleanup_subagent_messages(
     Returns number of messages cleaned up.
     """
     expired = await storage.get_expired_subagent_messages(max_age_seconds)
-    cleaned = 0
+    if not expired:
+        return 0
 
-    for msg_id, compact_text in expired:
-        try:
-            await notifier.edit_message(msg_id, compact_text, parse_mode="HTML")
-            cleaned += 1
-        except Exception:
-            pass  # Message might be deleted
-        finally:
-            await storage.delete_subagent_message(msg_id)
+    edit_slots = asyncio.Semaphore(MAX_CONCURRENT_EDITS)
 
-    return cleaned
+    async def dismiss(msg_id: int, compact_text: str) -> None:
+        async with edit_slots:
+            await notifier.edit_message(msg_id, compact_text, parse_mode="HTML")
 
+    # Failed edits are fine (the message might be deleted); tracking for
+    # every expired message is dropped either way
+    results = await asyncio.gather(
+        *(dismiss(msg_id, compact_text) for msg_id, compact_text in expired),
+        return_exceptions=True,
+    )
+    await storage.delete_subagent_messages([msg_id for msg_id, _ in expired])
 
-def _format_transcript_markdown(content: str, max_chars: int = 50000) -> str:
-    """Format JSONL transcript as readable markdown."""
-    lines = content.strip().split("\n")
-    sections = []
+    return sum(1 for result in results if not isinstance(result, Exception))
 
-    for line in lines:
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
 
-        msg_type = entry.get("type", "")
-        message = entry.get("message", {})
+def _format_transcript_markdown(path: Path, max_chars: int = 50000) -> str:
+    """Format a JSONL transcript file as readable markdown.
 
-        if msg_type == "user":
-            # User message
-            content_blocks = message.get("content", [])
-            text = ""
-            if isinstance(content_blocks, str):
-                text = content_blocks
-            elif isinstance(content_blocks, list):
-                for block in content_blocks:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text += block.get("text", "")
-            if text:
-                sections.append(f"## User\n\n{text}")
+    Lines are streamed from the file, and parsing stops once the output is
+    long enough to be truncated anyway.
+    """
+    header = "# Agent Session Log\n\n"
+    separator = "\n\n---\n\n"
+    sections: list[str] = []
+    length = len(header) - len(separator)
+
+    with open(path, "rb") as f:
+        for line in f:
+            if length > max_chars:
+                break
+            # Cheap check before parsing: most lines are tool results
+            if b'"user"' not in line and b'"assistant"' not in line:
+                continue
+            try:
+                entry = fastjson.loads(line)
+            except json.JSONDecodeError:
+                continue
 
-        elif msg_type == "assistant":
-            # Assistant message
-            content_blocks = message.get("content", [])
-            texts = []
-            if isinstance(content_blocks, str):
-                texts.append(content_blocks)
-            elif isinstance(content_blocks, list):
-                for block in content_blocks:
-                    if isinstance(block, dict):
-                        if block.get("type") == "text":
-                            texts.append(block.get("text", ""))
-                        elif block.get("type") == "tool_use":
-                            tool_name = block.get("name", "tool")
-                            texts.append(f"*[Using {tool_name}]*")
-            if texts:
-                sections.append("## Assistant\n\n" + "\n\n".join(texts))
+            msg_type = entry.get("type", "")
+            message = entry.get("message", {})
 
-    result = "# Agent Session Log\n\n" + "\n\n---\n\n".join(sections)
+            if msg_type == "user":
+                # User message
+                content_blocks = message.get("content", [])
+                text = ""
+                if isinstance(content_blocks, str):
+                    text = content_blocks
+                elif isinstance(content_blocks, list):
+                    text = "".join(
+                        block.get("text", "")
+                        for block in content_blocks
+                        if isinstance(block, dict) and block.get("type") == "text"
+                    )
+                if text:
+                    section = f"## User\n\n{text}"
+                    sections.append(section)
+                    length += len(separator) + len(section)
+
+            elif msg_type == "assistant":
+                # Assistant message
+                content_blocks = message.get("content", [])
+                texts = []
+                if isinstance(content_blocks, str):
+                    texts.append(content_blocks)
+                elif isinstance(content_blocks, list):
+                    for block in content_blocks:
+                        if isinstance(block, dict):
+                            if block.get("type") == "text":
+                                texts.append(block.get("text", ""))
+                            elif block.get("type") == "tool_use":
+                                tool_name = block.get("name", "tool")
+                                texts.append(f"*[Using {tool_name}]*")
+                if texts:
+                    section = "## Assistant\n\n" + "\n\n".join(texts)
+                    sections.append(section)
+                    length += len(separator) + len(section)
+
+    result = header + separator.join(sections)
 
     if len(result) > max_chars:
         result = result[:max_chars] + "\n\n... (truncated)"
@@ -99,39 +135,77 @@ def _extract_task_description(
         return None
 
     try:
-        content = path.read_text()
-        lines = content.strip().split("\n")
-
-        for line in lines:
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if entry.get("type") != "user":
-                continue
-
-            message = entry.get("message", {})
-            content_blocks = message.get("content", [])
-            text = ""
-            if isinstance(content_blocks, str):
-                text = content_blocks
-            elif isinstance(content_blocks, list):
-                for block in content_blocks:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text += block.get("text", "")
-
-            if text:
-                # Return first line only, truncated
-                first_line = text.split("\n")[0].strip()
-                if len(first_line) > max_chars:
-                    return first_line[:max_chars] + "..."
-                return first_line
+        # Stream lines: the first user entry is usually near the top, so
+        # the rest of the transcript is never read
+        with open(path, "rb") as f:
+            scanned = 0
+            for line in f:
+                scanned += len(line)
+                if scanned > _TRANSCRIPT_SCAN_LIMIT:
+                    break
+                # Only parse lines that can be user entries; transcripts are
+                # mostly assistant and tool output
+                if b'"user"' not in line:
+                    continue
+                try:
+                    entry = fastjson.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if entry.get("type") != "user":
+                    continue
+
+                message = entry.get("message", {})
+                content_blocks = message.get("content", [])
+                text = ""
+                if isinstance(content_blocks, str):
+                    text = content_blocks
+                elif isinstance(content_blocks, list):
+                    text = "".join(
+                        block.get("text", "")
+                        for block in content_blocks
+                        if isinstance(block, dict) and block.get("type") == "text"
+                    )
+
+                if text:
+                    # Return first line only, truncated
+                    first_line = text.split("\n")[0].strip()
+                    if len(first_line) > max_chars:
+                        return first_line[:max_chars] + "..."
+                    return first_line
         return None
     except Exception:
         return None
 
 
+def _iter_lines_reversed(
+    path: Path, block_size: int = 65536, max_bytes: Optional[int] = None
+) -> Iterator[bytes]:
+    """Yield a file's lines last to first, reading backwards in blocks.
+
+    Finding the last few entries of a long transcript then reads only its
+    tail instead of the whole file. With max_bytes, stops once that much of
+    the tail has been read.
+    """
+    with open(path, "rb") as f:
+        end = pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        while pos > 0:
+            if max_bytes is not None and end - pos >= max_bytes:
+                return  # partial is a cut-off line; don't yield it
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b"\n")
+            # The first piece may continue in the block before this one
+            partial = lines[0]
+            if len(lines) == 1:
+                block_size *= 2  # one very long line: read more per step
+            for line in reversed(lines[1:]):
+                yield line
+        yield partial
+
+
 def _extract_last_output(transcript_path: Optional[str], max_chars: int = 2000) -> str:
     """Extract the last assistant message from transcript."""
     if not transcript_path:
@@ -142,15 +216,14 @@ def _extract_last_output(transcript_path: Optional[str], max_chars: int = 2000)
         return "(transcript not found)"
 
     try:
-        content = path.read_text()
-
-        # Transcript is JSONL format - one JSON object per line
-        lines = content.strip().split("\n")
-
-        # Find the last assistant message (in reverse order)
-        for line in reversed(lines):
+        # Transcript is JSONL format - one JSON object per line.
+        # Find the last assistant message, reading from the end of the file
+        for line in _iter_lines_reversed(path, max_bytes=_TRANSCRIPT_SCAN_LIMIT):
+            # Skip parsing lines that can't be assistant entries
+            if b'"assistant"' not in line:
+                continue
             try:
-                entry = json.loads(line)
+                entry = fastjson.loads(line)
             except json.JSONDecodeError:
                 continue
 
@@ -173,11 +246,19 @@ def _extract_last_output(transcript_path: Optional[str], max_chars: int = 2000)
                             texts.append(text)
 
             if texts:
-                result = "\n\n".join(texts)
+                # Only the tail survives truncation, so join just enough
+                # trailing blocks to cover max_chars
+                tail = []
+                length = -2  # no separator before the first block
+                for text in reversed(texts):
+                    tail.append(text)
+                    length += len(text) + 2
+                    if length > max_chars:
+                        break
+                result = "\n\n".join(reversed(tail))
                 # Truncate if too long
-                if len(result) > max_chars:
-                    result = result[-max_chars:]
-                    result = "..." + result
+                if length > max_chars:
+                    result = "..." + result[-max_chars:]
                 return result
 
         return "(no agent output found)"
@@ -199,14 +280,10 @@ async def handle_subagent_stop(
     Returns:
         Response dict for Claude Code
     """
-    import sys
-    from owl.core.poller import Poller
-    from owl.utils.config import get_owl_dir
-
     if owl_dir is None:
         owl_dir = get_owl_dir()
 
-    config = Config(owl_dir)
+    config = get_config(owl_dir)
     project_path = hook_input.get("cwd")
 
     # Pass through when mode is off, project not enabled, or hook is disabled
@@ -225,8 +302,7 @@ async def handle_subagent_stop(
     debug_log = owl_dir / "subagent_debug.log"
 
     def log(msg: str) -> None:
-        with open(debug_log, "a") as f:
-            f.write(f"{time.strftime('%H:%M:%S')} {msg}\n")
+        append_log(debug_log, f"{time.strftime('%H:%M:%S')} {msg}")
         try:
             print(f"[owl] {msg}", file=sys.stderr, flush=True)
         except BrokenPipeError:
@@ -237,9 +313,18 @@ async def handle_subagent_stop(
     )
     transcript_path = hook_input.get("transcript_path")
 
-    # Get the agent's output and description
-    output_summary = _extract_last_output(transcript_path)
-    description = _extract_task_description(transcript_path)
+    # Get the agent's output and description. The transcript is read on
+    # worker threads while the database is opened and expired messages are
+    # dismissed; it's only needed once the notification is sent.
+    transcript_info = asyncio.gather(
+        asyncio.to_thread(_extract_last_output, transcript_path),
+        asyncio.to_thread(_extract_task_description, transcript_path),
+    )
+
+    # Deferred: aiosqlite/httpx are only needed once the hook is active
+    from owl.core.poller import Poller, wait_until_resolved
+    from owl.core.storage import Storage
+    from owl.notifiers.telegram import TelegramNotifier
 
     # Initialize components
     storage = Storage(config.db_path)
@@ -260,6 +345,7 @@ async def handle_subagent_stop(
                 log(f"Auto-dismissed {cleaned} expired messages")
 
         # Send notification with options
+        output_summary, description = await transcript_info
         msg_id, compact_text = await notifier.send_subagent_stop(
             subagent_id=subagent_id,
             output_summary=output_summary,
@@ -269,17 +355,23 @@ async def handle_subagent_stop(
 
         # Check if there's an existing entry for this subagent - if so, delete the old message
         existing = await storage.get_pending_subagent(subagent_id)
-        if existing and existing.get("telegram_msg_id"):
-            old_msg_id = existing["telegram_msg_id"]
-            if old_msg_id != msg_id:
-                try:
-                    await notifier.delete_message(old_msg_id)
-                    await storage.delete_subagent_message(old_msg_id)
-                except Exception:
-                    pass  # Old message might already be deleted
+        old_msg_id = existing.get("telegram_msg_id") if existing else None
 
-        # Create/update pending entry
-        await storage.create_pending_subagent(subagent_id, msg_id)
+        async def delete_old_message() -> None:
+            if not old_msg_id or old_msg_id == msg_id:
+                return
+            try:
+                await notifier.delete_message(old_msg_id)
+                await storage.delete_subagent_message(old_msg_id)
+            except Exception:
+                pass  # Old message might already be deleted
+
+        # Create/update pending entry while the old message is deleted;
+        # neither depends on the other
+        await asyncio.gather(
+            delete_old_message(),
+            storage.create_pending_subagent(subagent_id, msg_id),
+        )
         log(f"Created pending entry, msg_id={msg_id}")
 
         # Store for auto-dismiss
@@ -293,44 +385,24 @@ async def handle_subagent_stop(
         start = time.monotonic()
 
         try:
-            while True:
-                elapsed = time.monotonic() - start
-                if elapsed >= timeout:
-                    log(f"Timeout reached after {elapsed:.0f}s")
-                    return {}  # Timeout, let it stop
-
-                # Poll for updates
-                try:
-                    await poller.process_updates_once()
-                except Exception:
-                    pass
-
-                # Check if resolved
-                entry = await storage.get_pending_subagent(subagent_id)
-                if entry and entry["status"] != "pending":
-                    if entry["status"] == "continue" and entry["response"]:
-                        # User wants to continue with instructions
-                        # Format as explicit user instruction so Claude treats it as a new task
-                        user_instructions = f"The user has sent you new instructions via remote approval:\n\n{entry['response']}\n\nPlease follow these instructions."
-                        # Try both formats - with and without hookSpecificOutput
-                        response = {
-                            "decision": "block",
-                            "reason": user_instructions,
-                            # Also try hookSpecificOutput format in case that's needed
-                            "hookSpecificOutput": {
-                                "hookEventName": "SubagentStop",
-                                "decision": "block",
-                                "reason": user_instructions,
-                            },
-                        }
-                        log(f"Returning BLOCK with reason: {entry['response'][:100]}")
-                        return response
-                    else:
-                        # OK, let it stop
-                        log(f"Returning empty (let stop), status={entry['status']}")
-                        return {}
-
-                await asyncio.sleep(0.5)
+            entry = await wait_until_resolved(
+                poller,
+                lambda: storage.get_pending_subagent(subagent_id),
+                timeout=timeout,
+            )
+            if entry is None:
+                log(f"Timeout reached after {time.monotonic() - start:.0f}s")
+                return {}  # Timeout, let it stop
+
+            if entry["status"] == "continue" and entry["response"]:
+                # User wants to continue with instructions
+                # Format as explicit user instruction so Claude treats it as a new task
+                user_instructions = f"The user has sent you new instructions via remote approval:\n\n{entry['response']}\n\nPlease follow these instructions."
+                log(f"Returning BLOCK with reason: {entry['response'][:100]}")
+                return make_block_response("SubagentStop", user_instructions)
+            # OK, let it stop
+            log(f"Returning empty (let stop), status={entry['status']}")
+            return {}
         finally:
             await notifier.close()
 
@@ -2,4 +2,16 @@
 # hawk-hook: events=permission_request
 # hawk-hook: description=OWL AFK permission request gate
 # hawk-hook: timeout=3600
+# Fast path: answer without starting Python when owl is not enabled
+# (same rules as owl.fast_path.check_fast_path)
+mode_file="${OWL_DIR:-$HOME/.config/owl}/mode"
+if [[ ! -e "$mode_file" ]]; then
+    echo '{"decision": "approve"}'
+    exit 0
+fi
+read -r mode < "$mode_file"
+if [[ "$mode" == "off" ]]; then
+    echo '{}'
+    exit 0
+fi
 exec owl hook PermissionRequest
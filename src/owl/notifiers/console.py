@@ -4,6 +4,7 @@ import asyncio
 from typing import Optional
 
 from owl.notifiers.base import Notifier
+from owl.utils.formatting import format_project_id
 
 
 class ConsoleNotifier(Notifier):
@@ -34,13 +35,9 @@ class ConsoleNotifier(Notifier):
 
         # Compact format matching Telegram style
         input_summary = tool_input[:100] if tool_input else ""
-        if project_path:
-            parts = project_path.rstrip("/").split("/")
-            project_id = "/".join(parts[-2:]) if len(parts) >= 2 else parts[-1]
-        else:
-            project_id = session_id[:8]
-        print(f"{project_id}")
-        print(f"[{tool_name}] {input_summary}")
+        project_id = format_project_id(project_path, session_id)
+        # One print per message rather than one per line
+        print(f"{project_id}\n[{tool_name}] {input_summary}")
 
         return self._message_counter
 
@@ -63,6 +60,7 @@ class ConsoleNotifier(Notifier):
         details: Optional[dict] = None,
     ):
         """Print status update."""
-        print(f"[STATUS] Session {session_id}: {status}")
+        lines = [f"[STATUS] Session {session_id}: {status}"]
         if details:
-            print(f"  Details: {details}")
+            lines.append(f"  Details: {details}")
+        print("\n".join(lines))
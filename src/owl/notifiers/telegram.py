@@ -6,6 +6,7 @@ from typing import Any, Optional
 import httpx
 
 from owl.notifiers.base import Notifier
+from owl.utils import fastjson
 from owl.utils.debug import debug_api, debug_chain
 from owl.utils.formatting import (
     escape_html,
@@ -14,6 +15,17 @@ from owl.utils.formatting import (
     format_tool_summary,
 )
 
+# Update types getUpdates asks for (a JSON-serialized list, as the Bot API
+# expects in form data)
+_ALLOWED_UPDATES = json.dumps(["message", "callback_query"])
+
+# Seconds the HTTP read deadline for getUpdates runs past its long-poll timeout
+_LONG_POLL_GRACE = 10
+
+# reply_markup values that never vary, serialized once
+_NO_KEYBOARD_MARKUP = fastjson.dumps({"inline_keyboard": []})
+_FORCE_REPLY_MARKUP = fastjson.dumps({"force_reply": True, "selective": True})
+
 
 def format_approval_message(
     request_id: str,
@@ -47,6 +59,28 @@ def format_approval_message(
     return "\n".join(lines)
 
 
+def _build_chain_header(
+    project_path: Optional[str],
+    session_id: str,
+    description: Optional[str],
+    chain_title: Optional[str],
+) -> list[str]:
+    """Build the lines above a chain's command block: project, description, title."""
+    project_id = format_project_id(project_path, session_id)
+    lines = [f"<i>{escape_html(project_id)}</i>"]
+
+    if description:
+        desc = description[:100] + "..." if len(description) > 100 else description
+        lines.append(f"<i>{escape_html(desc)}</i>")
+
+    # Use custom title for compound commands, or default for chains
+    if chain_title:
+        lines.append(f"<b>{escape_html(chain_title)}</b>\n")
+    else:
+        lines.append("<b>Command chain approval:</b>\n")
+    return lines
+
+
 def _build_chain_command_block(
     commands: list[str],
     approved_indices: list[int],
@@ -57,9 +91,10 @@ def _build_chain_command_block(
 ) -> str:
     """Build a syntax-highlighted <pre> block for chain commands."""
     max_message_length = 4000
+    approved = set(approved_indices)  # checked once per command
 
     def _line(idx: int, cmd: str) -> str:
-        if idx in approved_indices:
+        if idx in approved:
             marker = "\u2713"
         elif idx == active_idx and not denied:
             marker = "\u2192"
@@ -72,23 +107,35 @@ def _build_chain_command_block(
             cmd_display = cmd_display[:300] + "..."
         return f"{marker} {cmd_display}"
 
-    all_lines = [_line(idx, cmd) for idx, cmd in enumerate(commands)]
-    block_text = "\n".join(all_lines)
-    escaped = escape_html(block_text)
-    result = f'<pre><code class="language-bash">{escaped}</code></pre>'
-
-    if header_length + len(result) > max_message_length and len(commands) > 10:
-        trunc_lines = [_line(idx, commands[idx]) for idx in range(min(20, len(commands)))]
-        trunc_lines.append(f"  ... {len(commands) - 30} more commands ...")
-        trunc_lines.extend(
-            _line(idx, commands[idx])
-            for idx in range(len(commands) - 10, len(commands))
-        )
-        block_text = "\n".join(trunc_lines)
-        escaped = escape_html(block_text)
-        result = f'<pre><code class="language-bash">{escaped}</code></pre>'
-
-    return result
+    def _block(lines: list[str]) -> str:
+        escaped = "\n".join(lines)
+        return f'<pre><code class="language-bash">{escaped}</code></pre>'
+
+    # Escape line by line (newlines need no escaping) and keep a running
+    # length, so an oversized chain switches to the truncated form as soon
+    # as it overflows instead of after building the whole block
+    budget = max_message_length - header_length - len(_block([]))
+    can_truncate = len(commands) > 10
+    escaped_lines = []
+    length = -1  # no newline before the first line
+    for idx, cmd in enumerate(commands):
+        line = escape_html(_line(idx, cmd))
+        length += len(line) + 1
+        if length > budget and can_truncate:
+            break
+        escaped_lines.append(line)
+    else:
+        return _block(escaped_lines)
+
+    trunc_lines = [
+        escape_html(_line(idx, commands[idx])) for idx in range(min(20, len(commands)))
+    ]
+    trunc_lines.append(f"  ... {len(commands) - 30} more commands ...")
+    trunc_lines.extend(
+        escape_html(_line(idx, commands[idx]))
+        for idx in range(len(commands) - 10, len(commands))
+    )
+    return _block(trunc_lines)
 
 
 def _truncate_pattern_label(pattern: str, max_len: int = 40) -> str:
@@ -172,7 +219,7 @@ class TelegramNotifier(Notifier):
             try:
                 client = await self._get_client()
                 response = await client.post(url, data=data, timeout=timeout)
-                result: dict[str, Any] = response.json()
+                result: dict[str, Any] = fastjson.loads(response.content)
 
                 # Check for retryable server errors (5xx)
                 if not result.get("ok"):
@@ -247,7 +294,7 @@ class TelegramNotifier(Notifier):
                 all_button_text = f"» All {server}: {method}"
         elif tool_name == "Bash" and tool_input:
             try:
-                data = json.loads(tool_input)
+                data = fastjson.loads(tool_input)
                 cmd = data.get("command", "")
                 first_word = cmd.split()[0] if cmd.split() else ""
                 if first_word:
@@ -354,7 +401,7 @@ class TelegramNotifier(Notifier):
                 "chat_id": self.chat_id,
                 "text": message,
                 "parse_mode": "HTML",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
 
@@ -390,7 +437,7 @@ class TelegramNotifier(Notifier):
         if parse_mode:
             data["parse_mode"] = parse_mode
         if remove_keyboard:
-            data["reply_markup"] = json.dumps({"inline_keyboard": []})
+            data["reply_markup"] = _NO_KEYBOARD_MARKUP
         result = await self._api_request("editMessageText", data=data)
         if not result.get("ok"):
             debug_api(
@@ -490,7 +537,7 @@ class TelegramNotifier(Notifier):
                 "message_id": message_id,
                 "text": f"{escaped_text}\n\n+ <b>Select rule pattern:</b>",
                 "parse_mode": "HTML",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
 
@@ -542,19 +589,30 @@ class TelegramNotifier(Notifier):
                 "message_id": message_id,
                 "text": message,
                 "parse_mode": "HTML",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
 
     async def get_updates(
         self, offset: Optional[int] = None, timeout: int = 30
     ) -> list[dict[str, Any]]:
-        """Get updates (for polling)."""
-        data = {"timeout": timeout}
+        """Get updates (for polling).
+
+        timeout is how long Telegram holds the request open waiting for an
+        update; the HTTP read deadline sits a little past it, so a long poll
+        isn't cut short but a dead connection doesn't hang the caller.
+        """
+        data: dict[str, Any] = {
+            "timeout": timeout,
+            # The poller only handles these; skip everything else server-side
+            "allowed_updates": _ALLOWED_UPDATES,
+        }
         if offset is not None:
             data["offset"] = offset
 
-        result = await self._api_request("getUpdates", data=data)
+        result = await self._api_request(
+            "getUpdates", data=data, timeout=timeout + _LONG_POLL_GRACE
+        )
         if result.get("ok") and "result" in result:
             updates: list[dict[str, Any]] = result.get("result", [])
             return updates
@@ -568,7 +626,7 @@ class TelegramNotifier(Notifier):
             data={
                 "chat_id": self.chat_id,
                 "text": f"Reply with feedback for denying {tool_name}:",
-                "reply_markup": json.dumps({"force_reply": True, "selective": True}),
+                "reply_markup": _FORCE_REPLY_MARKUP,
             },
         )
         debug_chain(
@@ -666,7 +724,7 @@ class TelegramNotifier(Notifier):
                 "chat_id": self.chat_id,
                 "text": text,
                 "parse_mode": "HTML",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
 
@@ -704,7 +762,7 @@ class TelegramNotifier(Notifier):
                 "chat_id": self.chat_id,
                 "text": text,
                 "parse_mode": "HTML",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
 
@@ -737,7 +795,7 @@ class TelegramNotifier(Notifier):
             data={
                 "chat_id": self.chat_id,
                 "text": "≡ Select rule pattern:",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
 
@@ -753,7 +811,7 @@ class TelegramNotifier(Notifier):
             data={
                 "chat_id": self.chat_id,
                 "text": "Reply with instructions for the agent:",
-                "reply_markup": json.dumps({"force_reply": True, "selective": True}),
+                "reply_markup": _FORCE_REPLY_MARKUP,
             },
         )
         if result.get("ok") and "result" in result:
@@ -794,28 +852,16 @@ class TelegramNotifier(Notifier):
         if approved_indices is None:
             approved_indices = []
 
-        # Format project identifier
-        project_id = format_project_id(project_path, session_id)
-
         # Build the message with stacked command list
-        lines = [f"<i>{escape_html(project_id)}</i>"]
-
-        if description:
-            desc = description[:100] + "..." if len(description) > 100 else description
-            lines.append(f"<i>{escape_html(desc)}</i>")
-
-        # Use custom title for compound commands, or default for chains
-        if chain_title:
-            lines.append(f"<b>{escape_html(chain_title)}</b>\n")
-        else:
-            lines.append("<b>Command chain approval:</b>\n")
+        lines = _build_chain_header(project_path, session_id, description, chain_title)
 
         # Strip wrapper prefix from display commands for cleaner UI
         display_prefix = (chain_title + " ") if chain_title else None
 
         # Find first unapproved command index
+        approved = set(approved_indices)
         first_unapproved = 0
-        while first_unapproved < len(commands) and first_unapproved in approved_indices:
+        while first_unapproved < len(commands) and first_unapproved in approved:
             first_unapproved += 1
 
         # Build syntax-highlighted command block
@@ -839,7 +885,7 @@ class TelegramNotifier(Notifier):
                 "chat_id": self.chat_id,
                 "text": message,
                 "parse_mode": "HTML",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
 
@@ -891,21 +937,8 @@ class TelegramNotifier(Notifier):
             raise ValueError(
                 f"current_idx {current_idx} out of bounds for {len(commands)} commands"
             )
-        # Format project identifier
-        project_id = format_project_id(project_path, session_id)
-
         # Build the message with stacked command list
-        lines = [f"<i>{escape_html(project_id)}</i>"]
-
-        if description:
-            desc = description[:100] + "..." if len(description) > 100 else description
-            lines.append(f"<i>{escape_html(desc)}</i>")
-
-        # Use custom title or default
-        if chain_title:
-            lines.append(f"<b>{escape_html(chain_title)}</b>\n")
-        else:
-            lines.append("<b>Command chain approval:</b>\n")
+        lines = _build_chain_header(project_path, session_id, description, chain_title)
 
         # Strip wrapper prefix from display commands for cleaner UI
         display_prefix = (chain_title + " ") if chain_title else None
@@ -956,6 +989,6 @@ class TelegramNotifier(Notifier):
                 "message_id": message_id,
                 "text": message,
                 "parse_mode": "HTML",
-                "reply_markup": json.dumps(keyboard),
+                "reply_markup": fastjson.dumps(keyboard),
             },
         )
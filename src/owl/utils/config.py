@@ -1,5 +1,6 @@
 """Configuration management."""
 
+import functools
 import json
 import os
 from pathlib import Path
@@ -13,6 +14,39 @@ def get_owl_dir() -> Path:
     return Path.home() / ".config" / "owl"
 
 
+def get_config(owl_dir: Optional[Path] = None) -> "Config":
+    """Get a Config, reusing the last one while its inputs are unchanged.
+
+    The cache key is config.json's (inode, mtime, size) plus the OWL_* and
+    EDITOR env vars, so edits are picked up on the next call. The instance
+    is shared - use Config() directly when changing settings.
+    """
+    owl_dir = owl_dir or get_owl_dir()
+    stamp: Optional[tuple[int, int, int]] = None
+    try:
+        st = os.stat(owl_dir / "config.json")
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    env = tuple(
+        sorted(
+            (k, v)
+            for k, v in os.environ.items()
+            if k.startswith("OWL_") or k == "EDITOR"
+        )
+    )
+    return _cached_config(owl_dir, stamp, env)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_config(
+    owl_dir: Path,
+    stamp: Optional[tuple[int, int, int]],
+    env: tuple[tuple[str, str], ...],
+) -> "Config":
+    return Config(owl_dir)
+
+
 class Config:
     """Application configuration."""
 
@@ -11,6 +11,19 @@ DEFAULT_POLL_INTERVAL = 0.5
 LONG_POLL_TIMEOUT = 30
 HTTP_CLIENT_TIMEOUT = 30
 
+# getUpdates long-poll timeout used while a hook waits on a reply
+WAIT_LONG_POLL = 25
+
+# Pause bounds for hooks waiting on a reply (Stop, SubagentStop): start
+# short, since most replies come soon after the notification, and grow
+# while the wait drags on
+WAIT_INTERVAL_MIN = 0.05
+WAIT_INTERVAL_MAX = 2.0
+
+# Telegram edits in flight at once when bulk-updating messages; kept low so
+# a burst stays within the Bot API's per-chat rate limits
+MAX_CONCURRENT_EDITS = 4
+
 # SQLite busy timeout (in milliseconds)
 SQLITE_BUSY_TIMEOUT_MS = 5000
 
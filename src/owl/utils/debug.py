@@ -1,12 +1,22 @@
 """Debug logging utility."""
 
+import atexit
+import os
 import sys
 from datetime import datetime
+from pathlib import Path
+from typing import TextIO
 
 from owl.utils.config import Config, get_owl_dir
 
 _config = None
 
+# Append handles kept open for the life of the process, one per log file
+_log_files: dict[Path, TextIO] = {}
+
+# Size past which a log file is moved aside to <name>.1 before appending
+LOG_MAX_BYTES = 5 * 1024 * 1024
+
 
 def _get_config() -> Config:
     """Get cached config instance."""
@@ -22,16 +32,51 @@ def reload_config():
     _config = None
 
 
+def _close_log_files() -> None:
+    for f in _log_files.values():
+        f.close()
+    _log_files.clear()
+
+
+atexit.register(_close_log_files)
+
+
+def append_log(path: Path, line: str) -> None:
+    """Append a line to a log file without reopening it on every call.
+
+    Handles are line buffered, so each line still reaches the file at once:
+    hooks that wait on Telegram can be killed before they exit. A file
+    already over LOG_MAX_BYTES is rotated to <name>.1 when it is opened.
+    """
+    f = _log_files.get(path)
+    if f is None or f.closed:
+        try:
+            if path.stat().st_size > LOG_MAX_BYTES:
+                os.replace(path, path.with_name(path.name + ".1"))
+        except FileNotFoundError:
+            pass
+        f = open(path, "a", buffering=1)
+        _log_files[path] = f
+    f.write(line + "\n")
+
+
 def _log_to_file(line: str):
     """Append line to debug log file."""
     try:
-        log_path = get_owl_dir() / "debug.log"
-        with open(log_path, "a") as f:
-            f.write(line + "\n")
+        append_log(get_owl_dir() / "debug.log", line)
     except Exception:
         pass
 
 
+def debug_enabled() -> bool:
+    """Whether debug mode is on.
+
+    For call sites whose arguments are costly to build (tracebacks, dumps);
+    plain debug_* calls already return early when it's off.
+    """
+    return bool(_get_config().debug)
+
+
 def debug(category: str, message: str, **kwargs):
     """Log debug message if debug mode is enabled.
 
@@ -0,0 +1,49 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install owl-afk[fast]``). Without it
+these fall back to the stdlib json module. orjson's decode error subclasses
+json.JSONDecodeError, so callers keep catching json.JSONDecodeError.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    # Only an error for mypy when orjson is installed, hence unused-ignore.
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string.
+
+    orjson output is compact and keeps non-ASCII characters as-is, so it is
+    not byte-identical to json.dumps; both parse back to the same value.
+    Values orjson refuses (e.g. integers beyond 64 bits) go through json.
+    """
+    if orjson is not None:
+        try:
+            text: str = orjson.dumps(obj).decode()
+            return text
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize obj to newline-terminated UTF-8 JSON, ready for a binary stream."""
+    if orjson is not None:
+        try:
+            line: bytes = orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+            return line
+        except TypeError:
+            pass
+    return (json.dumps(obj) + "\n").encode()
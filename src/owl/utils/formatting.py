@@ -9,7 +9,7 @@ def format_project_id(project_path: Optional[str], session_id: str) -> str:
     Returns last 2 path components or short session ID.
     """
     if project_path:
-        parts = project_path.rstrip("/").split("/")
+        parts = project_path.rstrip("/").rsplit("/", 2)
         return "/".join(parts[-2:]) if len(parts) >= 2 else parts[-1]
     return session_id[:8]
 
@@ -23,6 +23,9 @@ def truncate_command(cmd: str, max_len: int = 60) -> str:
 
 def escape_html(text: str) -> str:
     """Escape HTML special characters."""
+    # Most labels have none; `in` is a quick scan and returns text as-is
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
@@ -122,7 +122,7 @@ def generate_rule_patterns(
 
         if "/" in path:
             dir_path = path.rsplit("/", 1)[0]
-            short_dir = dir_path.split("/")[-1] or dir_path
+            short_dir = dir_path.rsplit("/", 1)[-1] or dir_path
             # Use wildcard prefix so pattern works across worktrees/machines
             patterns.append(
                 (f"{tool_name}(*/{short_dir}/*)", f"/ Any in .../{short_dir}/")
@@ -136,7 +136,7 @@ def generate_rule_patterns(
 
         # Add project-scoped pattern if project_path is available
         if project_path and path.startswith(project_path):
-            project_name = project_path.rstrip("/").split("/")[-1]
+            project_name = project_path.rstrip("/").rsplit("/", 1)[-1]
             if "." in path:
                 ext = path.rsplit(".", 1)[-1]
                 patterns.append(
@@ -161,13 +161,13 @@ def generate_rule_patterns(
 
         if "/" in path:
             dir_path = path.rsplit("/", 1)[0]
-            short_dir = dir_path.split("/")[-1] or dir_path
+            short_dir = dir_path.rsplit("/", 1)[-1] or dir_path
             # Use wildcard prefix so pattern works across worktrees/machines
             patterns.append((f"Read(*/{short_dir}/*)", f"/ Any in .../{short_dir}/"))
 
         # Add project-scoped pattern if project_path is available
         if project_path and path.startswith(project_path):
-            project_name = project_path.rstrip("/").split("/")[-1]
+            project_name = project_path.rstrip("/").rsplit("/", 1)[-1]
             # Use wildcard prefix so pattern works across worktrees/machines
             patterns.append((f"Read(*/{project_name}/*)", f"/ Any in {project_name}/"))
 
@@ -178,7 +178,7 @@ def generate_rule_patterns(
         path = os.path.expanduser(data["path"])
 
         if "/" in path:
-            short_dir = path.rstrip("/").split("/")[-1] or path
+            short_dir = path.rstrip("/").rsplit("/", 1)[-1] or path
             # Use wildcard prefix so pattern works across worktrees/machines
             patterns.append(
                 (f"{tool_name}(*/{short_dir}/*)", f"/ Any in .../{short_dir}/")
@@ -186,7 +186,7 @@ def generate_rule_patterns(
 
         # Add project-scoped pattern if project_path is available
         if project_path and path.startswith(project_path):
-            project_name = project_path.rstrip("/").split("/")[-1]
+            project_name = project_path.rstrip("/").rsplit("/", 1)[-1]
             patterns.append(
                 (f"{tool_name}(*/{project_name}/*)", f"/ Any in {project_name}/")
             )
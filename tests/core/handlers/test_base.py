@@ -1,7 +1,10 @@
 """Tests for handler base classes."""
 
+from unittest.mock import AsyncMock
 
-from owl.core.handlers.base import CallbackContext
+import pytest
+
+from owl.core.handlers.base import CallbackContext, answer_request_expired
 
 
 def test_callback_context_has_required_fields():
@@ -44,3 +47,28 @@ def test_callback_handler_protocol():
     assert hasattr(handler, "handle")
     # Verify it's callable
     assert callable(handler.handle)
+
+
+@pytest.mark.asyncio
+async def test_answer_request_expired_answers_and_edits():
+    """A missing request answers the callback and marks the message expired."""
+    notifier = AsyncMock()
+    ctx = CallbackContext(
+        target_id="req123",
+        callback_id="cb456",
+        message_id=789,
+        storage=None,
+        notifier=notifier,
+    )
+
+    await answer_request_expired(ctx)
+
+    notifier.answer_callback.assert_awaited_once_with("cb456", "Request not found")
+    notifier.edit_message.assert_awaited_once_with(789, "✗ Request expired")
+
+    ctx.message_id = None
+    notifier.reset_mock()
+    await answer_request_expired(ctx, "Request expired")
+
+    notifier.answer_callback.assert_awaited_once_with("cb456", "Request not found")
+    notifier.edit_message.assert_not_awaited()
@@ -1,6 +1,13 @@
 """Tests for hook response helpers."""
 
-from owl.hooks.response import make_hook_response
+import json
+
+from owl.hooks.response import (
+    fast_response,
+    make_block_response,
+    make_hook_response,
+    write_response,
+)
 
 
 class TestMakeHookResponse:
@@ -41,3 +48,47 @@ class TestMakeHookResponse:
         result = make_hook_response("PermissionRequest", decision="allow")
         assert result["hookSpecificOutput"]["hookEventName"] == "PermissionRequest"
         assert result["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+
+class TestMakeBlockResponse:
+    def test_stop_block(self):
+        result = make_block_response("Stop", "keep going")
+        assert result == {
+            "decision": "block",
+            "reason": "keep going",
+            "hookSpecificOutput": {
+                "hookEventName": "Stop",
+                "decision": "block",
+                "reason": "keep going",
+            },
+        }
+
+    def test_subagent_event_name(self):
+        result = make_block_response("SubagentStop", "more")
+        assert result["hookSpecificOutput"]["hookEventName"] == "SubagentStop"
+
+
+class TestFastResponse:
+    def test_matches_make_hook_response(self):
+        assert fast_response("PreToolUse", "allow") == make_hook_response(
+            "PreToolUse", decision="allow", reason="owl fast path: approve all"
+        )
+        assert fast_response("PermissionRequest", "deny") == make_hook_response(
+            "PermissionRequest", decision="deny", reason="owl fast path: deny all"
+        )
+
+    def test_returns_prebuilt_instance(self):
+        assert fast_response("PreToolUse", "deny") is fast_response(
+            "PreToolUse", "deny"
+        )
+
+
+class TestWriteResponse:
+    def test_writes_one_json_line(self, capsysbinary):
+        print("before")
+        write_response({"decision": "approve", "reason": "héllo"})
+        out = capsysbinary.readouterr().out
+        before, line = out.split(b"\n", 1)
+        assert before == b"before"
+        assert line.endswith(b"\n")
+        assert json.loads(line) == {"decision": "approve", "reason": "héllo"}
@@ -105,3 +105,23 @@ def test_tool_results_toggle_exists(tmp_path):
     config = Config(owl_dir)
     toggle_names = [name for name, _, _ in config.get_toggles()]
     assert "tool_results" in toggle_names
+
+
+def test_get_config_reuses_instance_until_inputs_change(mock_owl_dir, monkeypatch):
+    """get_config caches per config file state and OWL_* env."""
+    from owl.utils.config import get_config
+
+    config_file = mock_owl_dir / "config.json"
+    config_file.write_text(json.dumps({"timeout_seconds": 10}))
+
+    first = get_config(mock_owl_dir)
+    assert first.timeout_seconds == 10
+    assert get_config(mock_owl_dir) is first
+
+    config_file.write_text(json.dumps({"timeout_seconds": 200}))
+    second = get_config(mock_owl_dir)
+    assert second is not first
+    assert second.timeout_seconds == 200
+
+    monkeypatch.setenv("OWL_TIMEOUT_SECONDS", "30")
+    assert get_config(mock_owl_dir).timeout_seconds == 30
@@ -0,0 +1,54 @@
+"""Tests for debug logging helpers."""
+
+from owl.utils import debug
+
+
+def test_append_log_reuses_handle(tmp_path):
+    """Lines land in the file immediately through one kept-open handle."""
+    log_path = tmp_path / "test.log"
+
+    debug.append_log(log_path, "first")
+    handle = debug._log_files[log_path]
+    debug.append_log(log_path, "second")
+
+    assert debug._log_files[log_path] is handle
+    assert log_path.read_text() == "first\nsecond\n"
+
+
+def test_append_log_reopens_closed_handle(tmp_path):
+    """A closed handle is replaced rather than written to."""
+    log_path = tmp_path / "test.log"
+
+    debug.append_log(log_path, "first")
+    debug._close_log_files()
+    debug.append_log(log_path, "second")
+
+    assert log_path.read_text() == "first\nsecond\n"
+
+
+def test_append_log_rotates_oversized_file(tmp_path, monkeypatch):
+    """A log over the size cap is moved to .1 before new lines are appended."""
+    monkeypatch.setattr(debug, "LOG_MAX_BYTES", 10)
+    log_path = tmp_path / "test.log"
+    log_path.write_text("x" * 20 + "\n")
+
+    debug.append_log(log_path, "fresh")
+    debug._close_log_files()
+
+    assert log_path.read_text() == "fresh\n"
+    assert (tmp_path / "test.log.1").read_text() == "x" * 20 + "\n"
+
+
+def test_debug_enabled_follows_config(mock_owl_dir):
+    """debug_enabled reflects the debug setting after a config reload."""
+    from owl.utils.config import Config
+
+    debug.reload_config()
+    assert debug.debug_enabled() is False
+
+    Config(mock_owl_dir).set_debug(True)
+    debug.reload_config()
+    try:
+        assert debug.debug_enabled() is True
+    finally:
+        debug.reload_config()
@@ -40,3 +40,68 @@ def test_fast_path_invalid_mode(mock_owl_dir):
     result = check_fast_path(mock_owl_dir)
 
     assert result == FastPathResult.CONTINUE
+
+
+def test_fast_path_mode_with_trailing_newline(mock_owl_dir):
+    """Whitespace around the mode is ignored, prefixes are not enough."""
+    mode_file = mock_owl_dir / "mode"
+    mode_file.write_text("off\n")
+    assert check_fast_path(mock_owl_dir) == FastPathResult.FALLBACK
+
+    mode_file.write_text("offline")
+    assert check_fast_path(mock_owl_dir) == FastPathResult.CONTINUE
+
+
+def test_fast_path_default_dir_follows_owl_dir_env(mock_owl_dir, tmp_path, monkeypatch):
+    """Default mode file location tracks OWL_DIR changes."""
+    (mock_owl_dir / "mode").write_text("off")
+    assert check_fast_path() == FastPathResult.FALLBACK
+
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.setenv("OWL_DIR", str(other))
+    assert check_fast_path() == FastPathResult.APPROVE
+
+
+def test_fast_path_reuses_result_until_mode_file_changes(mock_owl_dir, monkeypatch):
+    """Unchanged mode file is not re-read; a change is picked up."""
+    import os
+
+    mode_file = mock_owl_dir / "mode"
+    mode_file.write_text("off")
+    assert check_fast_path(mock_owl_dir) == FastPathResult.FALLBACK
+
+    reads = []
+    real_read = os.read
+    monkeypatch.setattr(os, "read", lambda fd, n: reads.append(fd) or real_read(fd, n))
+    assert check_fast_path(mock_owl_dir) == FastPathResult.FALLBACK
+    assert reads == []
+
+    mode_file.write_text("on")
+    assert check_fast_path(mock_owl_dir) == FastPathResult.CONTINUE
+    assert len(reads) == 1
+
+    mode_file.unlink()
+    assert check_fast_path(mock_owl_dir) == FastPathResult.APPROVE
+
+
+@pytest.mark.parametrize(
+    "mode,code,output",
+    [(None, 0, '{"decision": "approve"}\n'), ("on", 2, "")],
+)
+def test_fast_path_main_output(mock_owl_dir, mode, code, output):
+    """fast_path_main writes the decision and exits with its code."""
+    import os
+    import subprocess
+    import sys
+
+    if mode is not None:
+        (mock_owl_dir / "mode").write_text(mode)
+    result = subprocess.run(
+        [sys.executable, "-c", "from owl.fast_path import fast_path_main; fast_path_main()"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "OWL_DIR": str(mock_owl_dir)},
+    )
+    assert result.returncode == code
+    assert result.stdout == output
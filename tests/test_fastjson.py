@@ -0,0 +1,21 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+import json
+
+from owl.utils import fastjson
+
+
+def test_dumps_round_trips():
+    """dumps output parses back to the original value."""
+    data = {"command": "echo héllo", "nested": {"n": [1, 2.5, None, True]}}
+    assert json.loads(fastjson.dumps(data)) == data
+
+
+def test_dumps_handles_big_integers():
+    """Integers beyond 64 bits still serialize."""
+    assert json.loads(fastjson.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_loads_accepts_bytes():
+    """loads parses str and bytes alike."""
+    assert fastjson.loads(b'{"a": 1}') == fastjson.loads('{"a": 1}') == {"a": 1}
@@ -1,6 +1,10 @@
 """Tests for formatting utilities."""
 
-from owl.utils.formatting import format_auto_approval_message
+from owl.utils.formatting import (
+    escape_html,
+    format_auto_approval_message,
+    format_project_id,
+)
 
 
 def test_format_auto_approval_message_single_command():
@@ -71,3 +75,20 @@ def test_format_auto_approval_uses_pre_block():
     )
     assert '<pre><code class="language-python">' in msg
     assert "python train.py" in msg
+
+
+def test_escape_html():
+    """Escapes &, < and >; text without them is returned unchanged."""
+    plain = "my-project/src"
+    assert escape_html(plain) is plain
+    assert escape_html("a && b > c <d>") == "a &amp;&amp; b &gt; c &lt;d&gt;"
+    assert escape_html("&lt;") == "&amp;lt;"
+
+
+def test_format_project_id():
+    """Shows the last two path components, or a short session id without a path."""
+    assert format_project_id("/home/user/code/owl", "session-123") == "code/owl"
+    assert format_project_id("/home/user/code/owl/", "session-123") == "code/owl"
+    assert format_project_id("/owl", "session-123") == "/owl"
+    assert format_project_id("owl", "session-123") == "owl"
+    assert format_project_id(None, "session-123") == "session-"
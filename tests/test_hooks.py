@@ -1,5 +1,7 @@
 """Tests for Claude Code hook handlers."""
 
+import json
+
 import pytest
 
 from owl.hooks.pretool import handle_pretool_use
@@ -67,3 +69,269 @@ async def test_pretool_extracts_context(mock_owl_dir):
     result = await handle_pretool_use(hook_input, mock_owl_dir)
 
     assert result["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+
+def test_notification_hooks_import_without_heavy_deps():
+    """Importing notification-only hooks doesn't load aiosqlite or httpx."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import owl.hooks.compact, owl.hooks.posttool, owl.hooks.session\n"
+        "import owl.hooks.stop, owl.hooks.subagent\n"
+        "print(sorted(m for m in ('aiosqlite', 'httpx') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_fast_path_approval_does_not_load_manager(tmp_path):
+    """Approve-all answers from pretool/permission never import the manager."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import asyncio, sys\n"
+        "from owl.hooks.permission import handle_permission_request\n"
+        "from owl.hooks.pretool import handle_pretool_use\n"
+        "hook_input = {'tool_name': 'Bash', 'tool_input': {'command': 'ls'}}\n"
+        "asyncio.run(handle_pretool_use(hook_input))\n"
+        "asyncio.run(handle_permission_request(hook_input))\n"
+        "print(sorted(m for m in ('aiosqlite', 'httpx', 'owl.core.manager') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "OWL_DIR": str(tmp_path)},
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_disabled_project_skips_request_work(tmp_path):
+    """A project outside enabled_projects falls back before tool_input is serialized."""
+    import os
+    import subprocess
+    import sys
+
+    from owl.utils.config import Config
+
+    config = Config(tmp_path)
+    config.set_mode("on")
+    config.add_enabled_project("/elsewhere")
+
+    code = (
+        "import asyncio, sys\n"
+        "from owl.hooks.permission import handle_permission_request\n"
+        "from owl.hooks.pretool import handle_pretool_use\n"
+        "hook_input = {'tool_name': 'Bash', 'tool_input': {'command': 'ls'}, 'cwd': '/project'}\n"
+        "print(asyncio.run(handle_pretool_use(hook_input)), asyncio.run(handle_permission_request(hook_input)))\n"
+        "print(sorted(m for m in ('owl.utils.fastjson', 'owl.core.manager') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "OWL_DIR": str(tmp_path)},
+    )
+    assert result.stdout.splitlines() == ["{} {}", "[]"]
+
+
+def test_hook_entry_point_skips_cli_imports(tmp_path):
+    """`owl hook` dispatches without importing Typer or package metadata."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import atexit, sys\n"
+        "atexit.register(lambda: print(sorted(\n"
+        "    m for m in ('typer', 'owl.cli', 'importlib.metadata') if m in sys.modules\n"
+        "), file=sys.stderr))\n"
+        "sys.argv = ['owl', 'hook', 'PreToolUse']\n"
+        "from owl.__main__ import cli_main\n"
+        "cli_main()\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "OWL_DIR": str(tmp_path)},
+    )
+    assert result.returncode == 0
+    assert json.loads(result.stdout) == {"decision": "approve"}
+    assert result.stderr.strip().splitlines()[-1] == "[]"
+
+
+def test_package_version_is_lazy():
+    """owl.__version__ still resolves when accessed."""
+    import owl
+
+    assert isinstance(owl.__version__, str)
+
+
+def test_subagent_transcript_extraction(tmp_path):
+    """Task description and last output come from the right transcript entries."""
+    from owl.hooks.subagent import _extract_last_output, _extract_task_description
+
+    entries = [
+        {"type": "user", "message": {"content": "Fix the bug\nin parser.py"}},
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": "Looking"}]}},
+        {"type": "progress", "data": "assistant is thinking about user"},
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": "Done"}]}},
+        {"type": "user", "message": {"content": [{"type": "tool_result"}]}},
+    ]
+    transcript = tmp_path / "transcript.jsonl"
+    transcript.write_text(
+        "\n".join(json.dumps(e) for e in entries) + "\nnot json\n", encoding="utf-8"
+    )
+
+    assert _extract_task_description(str(transcript)) == "Fix the bug"
+    assert _extract_last_output(str(transcript)) == "Done"
+
+    blocks = ["a" * 30, "b" * 30, "c" * 30]
+    transcript.write_text(
+        json.dumps(
+            {
+                "type": "assistant",
+                "message": {"content": [{"type": "text", "text": t} for t in blocks]},
+            }
+        )
+        + "\n"
+    )
+    full = "\n\n".join(blocks)
+    for max_chars in (10, 30, 32, 33, 61, len(full) - 1, len(full)):
+        expected = full if len(full) <= max_chars else "..." + full[-max_chars:]
+        assert _extract_last_output(str(transcript), max_chars=max_chars) == expected
+
+
+def test_subagent_lines_reversed_across_blocks(tmp_path):
+    """Reverse line iteration matches a forward split for any block size."""
+    from owl.hooks.subagent import _iter_lines_reversed
+
+    lines = [b"short", b"x" * 50, b"", b"middle line", b"y" * 7, b"last"]
+    path = tmp_path / "lines.jsonl"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+
+    for block_size in (1, 3, 8, 64, 4096):
+        assert list(_iter_lines_reversed(path, block_size)) == [b""] + lines[::-1]
+
+    # A byte cap stops the scan without yielding a cut-off line
+    assert list(_iter_lines_reversed(path, 4, max_bytes=10)) == [b"", b"last"]
+
+
+def test_subagent_transcript_markdown(tmp_path):
+    """Transcript markdown lists user/assistant turns and truncates long logs."""
+    from owl.hooks.subagent import _format_transcript_markdown
+
+    entries = [
+        {"type": "system", "content": "Session started"},
+        {"type": "user", "message": {"content": "Do it"}},
+        {"type": "progress", "data": {"message": "Running"}},
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "On it"},
+                    {"type": "tool_use", "name": "Bash"},
+                ]
+            },
+        },
+    ] + [{"type": "assistant", "message": {"content": "z" * 100}}] * 50
+    transcript = tmp_path / "transcript.jsonl"
+    transcript.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
+
+    result = _format_transcript_markdown(transcript, max_chars=200)
+
+    assert result.startswith(
+        "# Agent Session Log\n\n## User\n\nDo it\n\n---\n\n"
+        "## Assistant\n\nOn it\n\n*[Using Bash]*"
+    )
+    assert result.endswith("\n\n... (truncated)")
+    assert len(result) == 200 + len("\n\n... (truncated)")
+
+
+@pytest.mark.asyncio
+async def test_subagent_cleanup_dismisses_expired_messages(mock_owl_dir):
+    """Expired subagent messages are edited to compact form and untracked."""
+    from owl.core.storage import Storage
+    from owl.hooks.subagent import _lazy_cleanup_subagent_messages
+
+    edited = []
+
+    class Notifier:
+        async def edit_message(self, msg_id, text, parse_mode=None):
+            if msg_id == 2:
+                raise RuntimeError("message to edit not found")
+            edited.append((msg_id, text))
+
+    async with Storage(mock_owl_dir / "test.db") as storage:
+        for msg_id in (1, 2, 3):
+            await storage.store_subagent_message(msg_id, f"done {msg_id}")
+
+        cleaned = await _lazy_cleanup_subagent_messages(storage, Notifier(), -10)
+
+        assert cleaned == 2
+        assert sorted(edited) == [(1, "done 1"), (3, "done 3")]
+        assert await storage.get_expired_subagent_messages(-10) == []
+
+
+@pytest.mark.asyncio
+async def test_subagent_stop_sends_output_and_waits_for_reply(mock_owl_dir, monkeypatch):
+    """SubagentStop sends the transcript summary and blocks with the user's reply."""
+    import asyncio
+
+    from owl.core.storage import Storage
+    from owl.hooks.subagent import handle_subagent_stop
+    from owl.notifiers.telegram import TelegramNotifier
+    from owl.utils.config import Config
+
+    config = Config(mock_owl_dir)
+    config.telegram_bot_token = "test-token"
+    config.telegram_chat_id = "12345"
+    config.save()
+    config.set_mode("on")
+
+    transcript = mock_owl_dir / "transcript.jsonl"
+    transcript.write_text(
+        json.dumps({"type": "user", "message": {"content": "Review the diff"}})
+        + "\n"
+        + json.dumps({"type": "assistant", "message": {"content": "Looks good"}})
+        + "\n"
+    )
+
+    sent = []
+
+    async def send_subagent_stop(self, subagent_id, output_summary, **kwargs):
+        sent.append((subagent_id, output_summary, kwargs["description"]))
+        return 42, "compact"
+
+    async def get_updates(self, offset=None, timeout=30):
+        # The reply is handled by another process; this one sees no updates
+        if len(sent) == 1:
+            async with Storage(mock_owl_dir / "owl.db") as other:
+                await other.resolve_subagent("agent-1", "continue", "Check tests")
+            sent.append("replied")
+        await asyncio.sleep(60)
+        return []
+
+    monkeypatch.setattr(TelegramNotifier, "send_subagent_stop", send_subagent_stop)
+    monkeypatch.setattr(TelegramNotifier, "get_updates", get_updates)
+
+    result = await asyncio.wait_for(
+        handle_subagent_stop(
+            {"session_id": "agent-1", "transcript_path": str(transcript)},
+            mock_owl_dir,
+        ),
+        timeout=10,
+    )
+
+    assert sent == [("agent-1", "Looks good", "Review the diff"), "replied"]
+    assert result["decision"] == "block"
+    assert "Check tests" in result["reason"]
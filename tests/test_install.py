@@ -3,6 +3,9 @@
 import json
 import subprocess
 import sys
+from pathlib import Path
+
+import pytest
 
 
 def run_cli(*args, env=None, input_text=None):
@@ -299,6 +302,50 @@ def test_bundled_hooks_have_hawk_metadata():
         assert "exec owl hook " in content, f"{script.name} missing exec owl hook"
 
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize(
+    "script",
+    sorted((_REPO_ROOT / "hooks").glob("*.sh"))
+    + sorted((_REPO_ROOT / "src" / "owl" / "hooks_data").glob("*.sh")),
+    ids=lambda path: f"{path.parent.name}/{path.name}",
+)
+def test_hook_scripts_embed_shell_fast_path(script):
+    """Every wrapper script runs SHELL_FAST_PATH verbatim before exec owl hook."""
+    from owl.cli.install import SHELL_FAST_PATH
+
+    content = script.read_text()
+    assert SHELL_FAST_PATH + "exec owl hook " in content
+
+
+@pytest.mark.parametrize(
+    "mode,expected",
+    [(None, '{"decision": "approve"}'), ("off", "{}"), ("off\n", "{}")],
+)
+def test_bundled_hook_shell_fast_path(tmp_path, mode, expected):
+    """Bundled hooks answer without running owl when it is not enabled."""
+    import shutil
+
+    from owl.cli.install import _get_hooks_dir
+
+    owl_dir = tmp_path / "owl"
+    owl_dir.mkdir()
+    if mode is not None:
+        (owl_dir / "mode").write_text(mode)
+
+    script = _get_hooks_dir() / "owl-pre-tool-use.sh"
+    result = subprocess.run(
+        [shutil.which("bash"), str(script)],
+        env={"OWL_DIR": str(owl_dir), "PATH": ""},
+        capture_output=True,
+        text=True,
+        input="{}",
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == expected
+
+
 # --- normalize_hooks unit tests ---
 
 
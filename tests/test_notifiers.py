@@ -38,3 +38,15 @@ async def test_console_notifier_auto_approve():
 
     response = await notifier.wait_for_response("req-123", timeout=1)
     assert response == "approve"
+
+
+@pytest.mark.asyncio
+async def test_console_notifier_status_update(capsys):
+    """ConsoleNotifier prints a status update and its details."""
+    notifier = ConsoleNotifier()
+
+    await notifier.send_status_update("session-456", "idle", {"pending": 2})
+
+    assert capsys.readouterr().out == (
+        "[STATUS] Session session-456: idle\n  Details: {'pending': 2}\n"
+    )
@@ -83,6 +83,31 @@ async def test_poller_processes_callback(mock_owl_dir):
         assert request.status == "approved"
 
 
+@pytest.mark.asyncio
+async def test_sleep_remainder_only_sleeps_leftover(monkeypatch):
+    """A poll cycle that already took the interval isn't followed by a sleep."""
+    import asyncio
+    import time
+
+    from owl.core import poller as poller_module
+
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def tracking_sleep(delay):
+        sleeps.append(delay)
+        await real_sleep(delay)
+
+    monkeypatch.setattr(poller_module.asyncio, "sleep", tracking_sleep)
+
+    start = time.monotonic()
+    await poller_module.sleep_remainder(start - 1.0, 0.5)
+    await poller_module.sleep_remainder(time.monotonic(), 0.01)
+
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 0.01
+
+
 @pytest.mark.asyncio
 async def test_chain_rules_all_allow(mock_owl_dir):
     """Chain should auto-approve if all commands match allow rules."""
@@ -219,3 +244,198 @@ async def test_chain_approval_integration(mock_owl_dir):
     notifier.send_chain_approval_request.assert_not_called()
 
     await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_afk_off_edits_messages_concurrently(mock_owl_dir):
+    """/afk off defers every pending request, editing a few messages at once."""
+    import asyncio
+
+    from owl.core.storage import Storage
+    from owl.notifiers.telegram import TelegramNotifier
+    from owl.utils.constants import MAX_CONCURRENT_EDITS
+
+    async with Storage(mock_owl_dir / "test.db") as storage:
+        for msg_id in range(1, 11):
+            request_id = await storage.create_request(
+                session_id="session-123", tool_name="Bash", tool_input="{}"
+            )
+            await storage.set_telegram_msg_id(request_id, msg_id)
+
+        in_flight = 0
+        peak = 0
+        edited = []
+
+        async def edit_message(msg_id, text, parse_mode=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            edited.append(msg_id)
+            in_flight -= 1
+
+        notifier = MagicMock(spec=TelegramNotifier)
+        notifier.edit_message = edit_message
+        notifier.send_message = AsyncMock()
+
+        poller = Poller(storage, notifier, mock_owl_dir)
+        await poller._handle_afk_command("/afk off")
+
+        assert sorted(edited) == list(range(1, 11))
+        assert 1 < peak <= MAX_CONCURRENT_EDITS
+        assert await storage.get_pending_requests() == []
+
+
+@pytest.mark.asyncio
+async def test_afk_off_survives_failed_edit(mock_owl_dir):
+    """/afk off still turns AFK off when a message edit fails."""
+    import asyncio
+
+    from owl.core.storage import Storage
+    from owl.notifiers.telegram import TelegramNotifier
+    from owl.utils.config import Config
+
+    Config(mock_owl_dir).set_mode("on")
+    async with Storage(mock_owl_dir / "test.db") as storage:
+        for msg_id in range(1, 4):
+            request_id = await storage.create_request(
+                session_id="session-123", tool_name="Bash", tool_input="{}"
+            )
+            await storage.set_telegram_msg_id(request_id, msg_id)
+
+        edited = []
+
+        async def edit_message(msg_id, text, parse_mode=None):
+            if msg_id == 1:
+                raise RuntimeError("edit failed")
+            await asyncio.sleep(0.01)
+            edited.append(msg_id)
+
+        notifier = MagicMock(spec=TelegramNotifier)
+        notifier.edit_message = edit_message
+        notifier.send_message = AsyncMock()
+
+        poller = Poller(storage, notifier, mock_owl_dir)
+        await poller._handle_afk_command("/afk off")
+
+        assert sorted(edited) == [2, 3]
+        assert Config(mock_owl_dir).get_mode() == "off"
+        notifier.send_message.assert_awaited_once()
+        assert "disabled" in notifier.send_message.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_wait_until_resolved_wakes_on_handled_update(mock_owl_dir):
+    """An update handled by the long-poll task ends the wait right away."""
+    import asyncio
+    import time
+
+    from owl.core.poller import wait_until_resolved
+    from owl.core.storage import Storage
+
+    async with Storage(mock_owl_dir / "test.db") as storage:
+        await storage.create_pending_stop("session-123", 1)
+        poll_timeouts = []
+
+        async def process_updates_once(timeout=1):
+            poll_timeouts.append(timeout)
+            if len(poll_timeouts) == 1:
+                await asyncio.sleep(0.05)
+                await storage.resolve_stop("session-123", "ok")
+                return 1
+            await asyncio.sleep(60)  # long poll with nothing to deliver
+            return 0
+
+        poller = MagicMock(spec=Poller)
+        poller.lock = PollLock(mock_owl_dir / "poll.lock")
+        poller.process_updates_once = process_updates_once
+
+        start = time.monotonic()
+        entry = await wait_until_resolved(
+            poller, lambda: storage.get_pending_stop("session-123"), timeout=10
+        )
+
+        assert entry["status"] == "ok"
+        assert time.monotonic() - start < 1.0
+        assert poll_timeouts[0] > 1
+        # Lock is released once the wait ends
+        assert await poller.lock.acquire(timeout=0)
+        await poller.lock.release()
+
+
+@pytest.mark.asyncio
+async def test_wait_until_resolved_leaves_polling_to_leader(mock_owl_dir):
+    """While another poller holds the lock, the wait only re-reads the DB."""
+    import asyncio
+
+    from owl.core.poller import wait_until_resolved
+    from owl.core.storage import Storage
+
+    db_path = mock_owl_dir / "test.db"
+    leader_lock = PollLock(mock_owl_dir / "poll.lock")
+    assert await leader_lock.acquire(timeout=0)
+    try:
+        async with Storage(db_path) as storage, Storage(db_path) as other:
+            await storage.create_pending_stop("session-123", 1)
+
+            poller = MagicMock(spec=Poller)
+            poller.lock = PollLock(mock_owl_dir / "poll.lock")
+            poller.process_updates_once = AsyncMock(return_value=0)
+
+            async def resolve_later():
+                await asyncio.sleep(0.1)
+                await other.resolve_stop("session-123", "ok")
+
+            resolver = asyncio.create_task(resolve_later())
+            entry = await wait_until_resolved(
+                poller, lambda: storage.get_pending_stop("session-123"), timeout=10
+            )
+            await resolver
+
+            assert entry["status"] == "ok"
+            poller.process_updates_once.assert_not_called()
+    finally:
+        await leader_lock.release()
+
+
+@pytest.mark.asyncio
+async def test_wait_until_resolved_sees_other_process(mock_owl_dir):
+    """A resolution written by another connection is picked up without updates."""
+    import asyncio
+
+    from owl.core.poller import wait_until_resolved
+    from owl.core.storage import Storage
+
+    db_path = mock_owl_dir / "test.db"
+    async with Storage(db_path) as storage, Storage(db_path) as other:
+        await storage.create_pending_stop("session-123", 1)
+
+        async def process_updates_once(timeout=1):
+            await asyncio.sleep(60)
+            return 0
+
+        poller = MagicMock(spec=Poller)
+        poller.lock = PollLock(mock_owl_dir / "poll.lock")
+        poller.process_updates_once = process_updates_once
+
+        async def resolve_later():
+            await asyncio.sleep(0.1)
+            await other.resolve_stop("session-123", "comment", "one more thing")
+
+        resolver = asyncio.create_task(resolve_later())
+        entry = await wait_until_resolved(
+            poller, lambda: storage.get_pending_stop("session-123"), timeout=10
+        )
+        await resolver
+
+        assert entry["status"] == "comment"
+        assert entry["response"] == "one more thing"
+
+        # Nothing left to resolve: times out with None
+        await storage.create_pending_stop("session-456", 2)
+        assert (
+            await wait_until_resolved(
+                poller, lambda: storage.get_pending_stop("session-456"), timeout=0.1
+            )
+            is None
+        )
@@ -29,7 +29,7 @@ async def test_posttool_edits_message_with_result(tmp_path):
         "tool_response": {"stdout": "Done!", "exit_code": 0},
     }
 
-    with patch("owl.hooks.posttool.Storage") as MockStorage, \
+    with patch("owl.core.storage.Storage") as MockStorage, \
          patch("owl.notifiers.telegram.TelegramNotifier") as MockTelegram:
         mock_storage = AsyncMock()
         MockStorage.return_value = mock_storage
@@ -80,7 +80,7 @@ async def test_posttool_skips_results_when_disabled(tmp_path):
         "tool_response": {"stdout": "file.txt", "exit_code": 0},
     }
 
-    with patch("owl.hooks.posttool.Storage") as MockStorage:
+    with patch("owl.core.storage.Storage") as MockStorage:
         mock_storage = AsyncMock()
         MockStorage.return_value = mock_storage
         mock_storage.get_pending_messages.return_value = []
@@ -112,7 +112,7 @@ async def test_posttool_skips_unsupported_tools(tmp_path):
         "tool_response": {"content": "file contents"},
     }
 
-    with patch("owl.hooks.posttool.Storage") as MockStorage:
+    with patch("owl.core.storage.Storage") as MockStorage:
         mock_storage = AsyncMock()
         MockStorage.return_value = mock_storage
         mock_storage.get_pending_messages.return_value = []
@@ -1,5 +1,7 @@
 """Tests for auto-approve rules engine."""
 
+import sys
+
 import pytest
 
 from owl.core.rules import (
@@ -29,6 +31,17 @@ def test_matches_pattern_glob_path():
     assert matches_pattern("Read(/home/user/test.js)", "Read(*.py)") is False
 
 
+def test_matches_pattern_brackets_are_literal():
+    """Square brackets in patterns match literally, not as glob classes."""
+    assert matches_pattern("Bash(test [ -f x ])", "Bash(test [ -f * ])") is True
+    assert matches_pattern("Bash(test f)", "Bash(test [f])") is False
+
+
+def test_format_tool_call_invalid_json():
+    """Malformed tool input falls back to the bare tool name."""
+    assert format_tool_call("Bash", "{not json") == "Bash()"
+
+
 @pytest.mark.asyncio
 async def test_rules_engine_no_rules(mock_owl_dir):
     """No rules means no auto-approve."""
@@ -141,6 +154,16 @@ def test_normalize_command_preserves_apostrophes():
     assert normalize_command_for_matching("echo \"it's fine\"") == "echo it's fine"
 
 
+def test_normalize_command_unquoted_fast_path():
+    """Unquoted commands collapse whitespace and expand leading tildes."""
+    import os
+
+    home = os.path.expanduser("~")
+    assert normalize_command_for_matching("git   status\t-s") == "git status -s"
+    assert normalize_command_for_matching("ls ~/src a~b") == f"ls {home}/src a~b"
+    assert normalize_command_for_matching("") == ""
+
+
 def test_format_tool_call_normalizes_quotes():
     """format_tool_call strips quotes for consistent matching."""
     # Command with single quotes
@@ -171,3 +194,176 @@ async def test_rules_engine_matches_quoted_commands(mock_owl_dir):
             "Bash", '{"command": "ssh aarni \'docker exec bouillon bash -c crontab\'"}'
         )
         assert result == "approve"
+
+
+@pytest.mark.asyncio
+async def test_rules_engine_first_matching_rule_wins(mock_owl_dir):
+    """The fused matcher returns the highest-priority matching rule."""
+    from owl.core.storage import Storage
+
+    db_path = mock_owl_dir / "test.db"
+    async with Storage(db_path) as storage:
+        engine = RulesEngine(storage)
+        await engine.add_rule("Bash(git *)", "approve", priority=0)
+        await engine.add_rule("Bash(git push *)", "deny", priority=5)
+        await engine.add_rule("Read(*.py)", "approve", priority=1)
+
+        assert await engine.check("Bash", '{"command": "git push origin"}') == "deny"
+        assert await engine.check("Bash", '{"command": "git status"}') == "approve"
+        assert await engine.check("Read", '{"file_path": "/a/b.PY"}') == "approve"
+        assert await engine.check("Read", '{"file_path": "/a/b.js"}') is None
+
+
+@pytest.mark.asyncio
+async def test_rules_engine_cache_reset_on_rule_change(mock_owl_dir):
+    """Adding or removing a rule through the engine refreshes its cache."""
+    from owl.core.storage import Storage
+
+    db_path = mock_owl_dir / "test.db"
+    async with Storage(db_path) as storage:
+        engine = RulesEngine(storage)
+        assert await engine.check("Bash", '{"command": "ls"}') is None
+
+        rule_id = await engine.add_rule("Bash(ls*)", "approve")
+        assert await engine.check("Bash", '{"command": "ls -la"}') == "approve"
+
+        await engine.remove_rule(rule_id)
+        assert await engine.check("Bash", '{"command": "ls -la"}') is None
+
+
+@pytest.mark.asyncio
+async def test_rules_engine_skips_invalid_pattern(mock_owl_dir):
+    """A pattern that is not a valid regex does not break other rules."""
+    from owl.core.storage import Storage
+
+    db_path = mock_owl_dir / "test.db"
+    async with Storage(db_path) as storage:
+        engine = RulesEngine(storage)
+        await engine.add_rule("Bash(echo \\)", "approve", priority=10)
+        await engine.add_rule("Bash(echo *)", "approve")
+
+        assert await engine.check("Bash", '{"command": "echo hi"}') == "approve"
+
+
+@pytest.mark.asyncio
+async def test_rules_engine_priority_across_pattern_kinds(mock_owl_dir):
+    """Priority decides between literal, prefix, suffix and complex rules."""
+    from owl.core.storage import Storage
+
+    db_path = mock_owl_dir / "test.db"
+    async with Storage(db_path) as storage:
+        engine = RulesEngine(storage)
+        await engine.add_rule("Read(*.env)", "deny", priority=30)
+        await engine.add_rule("Read(/tmp/?.py)", "deny", priority=20)
+        await engine.add_rule("Read(/tmp/*)", "approve", priority=10)
+        await engine.add_rule("*)", "deny", priority=5)
+        await engine.add_rule("Glob", "approve", priority=1)
+
+        assert await engine.check("Read", '{"file_path": "/tmp/.env"}') == "deny"
+        assert await engine.check("Read", '{"file_path": "/tmp/a.py"}') == "deny"
+        assert await engine.check("Read", '{"file_path": "/tmp/ab.py"}') == "approve"
+        assert await engine.check("Write", '{"file_path": "/x"}') == "deny"
+        assert await engine.check("glob") == "deny"  # "glob()" hits "*)"
+        assert await engine.check("Bash", '{"command": "READ"}') == "deny"
+
+
+def test_rule_index_matches_multiline_commands_like_regex():
+    """Multi-line tool calls fall back to regex semantics ("." skips newlines)."""
+    from owl.core.rules import _RuleIndex
+
+    index = _RuleIndex((("Bash(git *)", "approve"),))
+    assert index.match("Bash(git status)") == "approve"
+    assert index.match("BASH(GIT status)") == "approve"
+    assert index.match("Bash(git commit\nrm -rf /)") is None
+
+
+def test_translate_all_matches_single_translation():
+    """Batch translation gives the same regex bodies as one-by-one."""
+    from owl.core.rules import _translate, _translate_all
+
+    patterns = ["Bash(git *)", "Read(?.py)", "Bash(echo a\0b)", "Edit(/x/[y])"]
+    assert _translate_all(patterns) == [_translate(p) for p in patterns]
+    assert _translate_all([]) == []
+
+
+def _fake_re2(monkeypatch, compile_fails=False):
+    """Install a stand-in google-re2 module backed by the stdlib engine."""
+    import re
+    import types
+
+    fake = types.ModuleType("re2")
+    fake.compiled = []
+
+    class Options:
+        case_sensitive = True
+
+    class error(Exception):
+        pass
+
+    def compile(source, options):
+        if compile_fails:
+            raise error("unsupported")
+        regex = re.compile(source, 0 if options.case_sensitive else re.IGNORECASE)
+        fake.compiled.append(regex)
+        return regex
+
+    fake.Options = Options
+    fake.error = error
+    fake.compile = compile
+    monkeypatch.setitem(sys.modules, "re2", fake)
+    return fake
+
+
+@pytest.fixture
+def clear_re2_cache():
+    """Forget the cached re2 import before and after a test."""
+    from owl.core import rules
+
+    rules._re2_module.cache_clear()
+    yield
+    rules._re2_module.cache_clear()
+
+
+def test_rule_index_uses_re2_when_available(monkeypatch, clear_re2_cache):
+    """ASCII complex globs compile through re2, case-insensitively."""
+    from owl.core.rules import _RuleIndex
+
+    fake = _fake_re2(monkeypatch)
+    index = _RuleIndex(
+        (("Bash(git * --force*)", "deny"), ("Read(/tmp/?.py)", "approve"))
+    )
+
+    assert fake.compiled and index._complex[0] is fake.compiled[0]
+    assert index.match("bash(GIT PUSH --FORCE)") == "deny"
+    assert index.match("Read(/tmp/a.py)") == "approve"
+
+
+def test_rule_index_falls_back_when_re2_rejects(monkeypatch, clear_re2_cache):
+    """A pattern re2 can't compile falls back to the stdlib engine."""
+    from owl.core.rules import _RuleIndex
+
+    _fake_re2(monkeypatch, compile_fails=True)
+    index = _RuleIndex((("Bash(git * --force*)", "deny"),))
+
+    assert type(index._complex[0]).__module__ == "re"
+    assert index.match("Bash(git push --force)") == "deny"
+
+
+def test_rule_index_complex_rules_with_re2():
+    """Complex globs give the same priority winner under google-re2."""
+    pytest.importorskip("re2")
+    from owl.core.rules import _RuleIndex
+
+    index = _RuleIndex(
+        (
+            ("Bash(git * --force*)", "deny"),
+            ("Bash(git *)", "approve"),
+            ("Read(/tmp/?.py)", "approve"),
+        )
+    )
+    assert type(index._complex[0]).__module__.startswith("re2")
+    assert index.match("Bash(git push --force origin)") == "deny"
+    assert index.match("bash(GIT PUSH --FORCE)") == "deny"
+    assert index.match("Bash(git push origin)") == "approve"
+    assert index.match("Read(/tmp/a.py)") == "approve"
+    assert index.match("Read(/tmp/ab.py)") is None
@@ -101,3 +101,229 @@ async def test_storage_audit_log(mock_owl_dir):
         entries = await storage.get_audit_log(limit=10)
         assert len(entries) == 1
         assert entries[0].event_type == "request"
+
+
+@pytest.mark.asyncio
+async def test_storage_audit_log_decodes_details(mock_owl_dir):
+    """Audit details round-trip; entries without details get an empty dict."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        await storage.log_audit("request", "s1", {"tool": "Bash", "args": [1, "ü"]})
+        await storage.log_audit("stop", "s1")
+
+        entries = await storage.get_audit_log(limit=10)
+
+    details = {entry.event_type: entry.details for entry in entries}
+    assert details == {"request": {"tool": "Bash", "args": [1, "ü"]}, "stop": {}}
+
+
+@pytest.mark.asyncio
+async def test_storage_batch_commits_once(mock_owl_dir):
+    """Writes inside batch() become visible to other connections on exit."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage, Storage(db_path) as reader:
+        async with storage.batch():
+            await storage.upsert_session("s1", "/a")
+            await storage.upsert_session("s2", "/b")
+            assert await reader.get_session("s1") is None
+
+        assert await reader.get_session("s1") is not None
+        assert await reader.get_session("s2") is not None
+
+
+@pytest.mark.asyncio
+async def test_storage_batch_rolls_back_on_error(mock_owl_dir):
+    """A failing batch discards its writes."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        with pytest.raises(RuntimeError):
+            async with storage.batch():
+                await storage.upsert_session("s1", "/a")
+                raise RuntimeError("boom")
+
+        assert await storage.get_session("s1") is None
+
+
+@pytest.mark.asyncio
+async def test_storage_stale_chain_save_keeps_batch(mock_owl_dir):
+    """A stale save_chain_state_atomic inside batch() keeps the batch's writes."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage, Storage(db_path) as reader:
+        await storage.save_chain_state(42, "{}")
+        _, version = await storage.get_chain_state(42)
+
+        async with storage.batch():
+            await storage.upsert_session("s1", "/a")
+            assert not await storage.save_chain_state_atomic(42, "{}", version - 1)
+            assert await reader.get_session("s1") is None
+
+        assert await reader.get_session("s1") is not None
+        assert await storage.save_chain_state_atomic(42, '{"step": 1}', version)
+
+
+@pytest.mark.asyncio
+async def test_storage_mark_messages_delivered(mock_owl_dir):
+    """Bulk delivery marks every given message."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        await storage.add_pending_message("s1", "one")
+        await storage.add_pending_message("s1", "two")
+        pending = await storage.get_pending_messages("s1")
+
+        await storage.mark_messages_delivered([msg_id for msg_id, _ in pending])
+
+        assert await storage.get_pending_messages("s1") == []
+
+
+@pytest.mark.asyncio
+async def test_storage_take_pending_messages(mock_owl_dir):
+    """Taking pending messages returns them in order and delivers them."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        assert await storage.take_pending_messages("s1") == []
+        await storage.add_pending_message("s1", "one")
+        await storage.add_pending_message("s1", "two")
+        await storage.add_pending_message("s2", "other")
+
+        assert await storage.take_pending_messages("s1") == ["one", "two"]
+        assert await storage.take_pending_messages("s1") == []
+        assert await storage.get_pending_messages("s2") != []
+
+
+@pytest.mark.asyncio
+async def test_storage_mark_messages_delivered_large_batch(mock_owl_dir):
+    """Batches beyond one statement's parameter limit are all marked."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        sessions = [f"s{n}" for n in range(12)]
+        async with storage.batch():
+            for session_id in sessions:
+                for i in range(100):
+                    await storage.add_pending_message(session_id, f"msg {i}")
+        ids = [
+            msg_id
+            for session_id in sessions
+            for msg_id, _ in await storage.get_pending_messages(session_id)
+        ]
+        assert len(ids) == 1200
+
+        await storage.mark_messages_delivered(ids)
+
+        for session_id in sessions:
+            assert await storage.get_pending_messages(session_id) == []
+
+
+@pytest.mark.asyncio
+async def test_storage_connection_pragmas(mock_owl_dir):
+    """New databases use WAL, 8 KiB pages and a larger page cache."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        pragmas = {}
+        for name in ("journal_mode", "page_size", "cache_size"):
+            cursor = await storage.conn.execute(f"PRAGMA {name}")
+            row = await cursor.fetchone()
+            pragmas[name] = row[0]
+
+    assert pragmas == {"journal_mode": "wal", "page_size": 8192, "cache_size": -65536}
+
+
+@pytest.mark.asyncio
+async def test_storage_rules_for_matching_uses_covering_index(mock_owl_dir):
+    """Rule loading scans the priority index without sorting."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        await storage.add_rule("Bash(git *)", "approve", 1, "cli")
+        await storage.add_rule("Read", "approve", 5, "cli")
+        await storage.add_rule("Bash(ls *)", "approve", 1, "cli")
+
+        cursor = await storage.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT pattern, action FROM auto_approve_rules "
+            "ORDER BY priority DESC, id"
+        )
+        plan = " ".join(row[3] for row in await cursor.fetchall())
+        assert "COVERING INDEX idx_rules_priority" in plan
+
+        rules = await storage.get_rules_for_matching()
+        assert [pattern for pattern, _ in rules] == ["Read", "Bash(git *)", "Bash(ls *)"]
+
+
+@pytest.mark.asyncio
+async def test_storage_rows_map_to_slotted_dataclasses(mock_owl_dir):
+    """Rows map onto the dataclass fields by position."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        request_id = await storage.create_request("s1", "Bash", '{"command": "ls"}')
+        await storage.resolve_request(request_id, "denied", "user", denial_reason="no")
+        await storage.upsert_session("s1", "/proj")
+
+        request = await storage.get_request(request_id)
+        session = await storage.get_session("s1")
+
+    assert not hasattr(request, "__dict__")
+    assert request.tool_input == '{"command": "ls"}'
+    assert request.status == "denied"
+    assert request.denial_reason == "no"
+    assert session.project_path == "/proj"
+    assert session.status == "active"
+
+
+@pytest.mark.asyncio
+async def test_storage_rules_cache_sees_other_connections(mock_owl_dir):
+    """Cached rules refresh after another connection changes them."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage, Storage(db_path) as other:
+        await storage.add_rule("Read", "approve", 0, "cli")
+        assert await storage.get_rules_for_matching() == [("Read", "approve")]
+        assert await storage.get_rules_for_matching() == [("Read", "approve")]
+
+        rule_id = await other.add_rule("Bash(git *)", "approve", 5, "cli")
+        assert await storage.get_rules_for_matching() == [
+            ("Bash(git *)", "approve"),
+            ("Read", "approve"),
+        ]
+
+        await storage.remove_rule(rule_id)
+        assert await storage.get_rules_for_matching() == [("Read", "approve")]
+
+
+@pytest.mark.asyncio
+async def test_storage_connect_applies_schema_once(mock_owl_dir):
+    """Reconnecting skips the schema script unless the schema version differs."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage:
+        await storage.conn.execute("DROP TABLE pending_messages")
+        await storage.conn.commit()
+
+    async with Storage(db_path) as storage:
+        assert "pending_messages" not in await storage.list_tables()
+        await storage.conn.execute("PRAGMA user_version=0")
+        await storage.conn.commit()
+
+    async with Storage(db_path) as storage:
+        assert "pending_messages" in await storage.list_tables()
+
+
+@pytest.mark.asyncio
+async def test_storage_data_version_tracks_other_connections(mock_owl_dir):
+    """data_version moves on another connection's commit, not on our own."""
+    db_path = mock_owl_dir / "test.db"
+
+    async with Storage(db_path) as storage, Storage(db_path) as other:
+        before = await storage.data_version()
+        await storage.upsert_session("session-1", "/project")
+        assert await storage.data_version() == before
+
+        await other.upsert_session("session-2", "/project")
+        assert await storage.data_version() != before
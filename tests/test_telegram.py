@@ -429,3 +429,60 @@ async def test_chain_approval_without_title_shows_default():
         # Should show the commands
         assert "git add ." in text
         assert "git commit" in text
+
+
+@pytest.mark.asyncio
+async def test_get_updates_long_poll_deadline():
+    """getUpdates asks only for handled update types, with a read deadline past the poll."""
+    notifier = TelegramNotifier(bot_token="test-token", chat_id="12345")
+
+    with patch.object(notifier, "_api_request", new_callable=AsyncMock) as mock_api:
+        mock_api.return_value = {"ok": True, "result": [{"update_id": 7}]}
+
+        updates = await notifier.get_updates(offset=7, timeout=25)
+
+        assert updates == [{"update_id": 7}]
+        data = mock_api.call_args.kwargs["data"]
+        assert data["timeout"] == 25
+        assert data["offset"] == 7
+        assert json.loads(data["allowed_updates"]) == ["message", "callback_query"]
+        assert mock_api.call_args.kwargs["timeout"] > 25
+
+
+@pytest.mark.asyncio
+async def test_constant_reply_markups():
+    """Keyboard removal and force-reply prompts send the expected markup."""
+    notifier = TelegramNotifier(bot_token="test-token", chat_id="12345")
+
+    with patch.object(notifier, "_api_request", new_callable=AsyncMock) as mock_api:
+        mock_api.return_value = {"ok": True, "result": {"message_id": 5}}
+
+        await notifier.edit_message(5, "done")
+        markup = json.loads(mock_api.call_args.kwargs["data"]["reply_markup"])
+        assert markup == {"inline_keyboard": []}
+
+        await notifier.send_feedback_prompt("Bash")
+        markup = json.loads(mock_api.call_args.kwargs["data"]["reply_markup"])
+        assert markup == {"force_reply": True, "selective": True}
+
+
+def test_chain_command_block_truncates_past_message_limit():
+    """A chain block is truncated only once header plus block exceed 4000 chars."""
+    from owl.notifiers.telegram import _build_chain_command_block
+
+    commands = [f"echo {i} && true" for i in range(40)]
+    full = _build_chain_command_block(commands, [], active_idx=0)
+    assert "more commands" not in full
+    assert "echo 39 &amp;&amp; true" in full
+
+    fits = _build_chain_command_block(
+        commands, [], active_idx=0, header_length=4000 - len(full)
+    )
+    assert fits == full
+
+    truncated = _build_chain_command_block(
+        commands, [], active_idx=0, header_length=4001 - len(full)
+    )
+    assert "  ... 10 more commands ..." in truncated
+    assert "echo 19 &amp;&amp;" in truncated and "echo 20 &amp;&amp;" not in truncated
+    assert "echo 30 &amp;&amp;" in truncated